@@ -16,19 +16,38 @@
 """Convert .adoc formatted RHOSO documentation to text formatted files."""
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import ctypes
+import fnmatch
+import functools
+import gc
+import hashlib
+import html
+import itertools
 import json
+import os
 from pathlib import Path
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import multiprocessing
 from packaging.version import Version
 from typing import Generator, Tuple
 import xml.etree.ElementTree as ET
 
 import defusedxml.ElementTree as DefusedET
+from lxml import etree
+from lxml import html as lxml_html
+from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
 import re
+import signal
+import stat
 import subprocess
 import tempfile
 import fcntl
+import threading
 import time
+import zlib
 
 LOG = logging.getLogger()
 logging.basicConfig(level=logging.INFO)
@@ -36,6 +55,121 @@ logging.basicConfig(level=logging.INFO)
 # Output file extension for converted documents
 OUTPUT_FILE_EXTENSION = ".txt"
 
+# Prefix of the temporary AsciiDoc files written in the doc tree while a
+# document is converted, so they are never taken for source files
+_TEMPORARY_ADOC_PREFIX = "rhoso_adoc_tmp_"
+
+# docinfo.xml metadata elements, matched on the raw bytes of the file
+_PRODUCTNUMBER_RE = re.compile(rb"<productnumber>([^<]*)</productnumber>")
+_TITLE_RE = re.compile(rb"<title>([^<]*)</title>")
+
+# Links with square brackets in the text portion: link:url[text] where text
+# contains [ or ]
+_LINK_BRACKETS_RE = re.compile(r"(link:[^\[]+\[)([^\]]*[\[\]][^\]]*?)(\])")
+# Callout marker in a code block (<1>) and callout definition after it
+_CALLOUT_RE = re.compile(r"<(\d+)>")
+_CALLOUT_DEFINITION_RE = re.compile(r"^<(\d+)>\s+")
+# Renumbered callout markers, blocks rarely have more than a handful
+_CALLOUT_TOKENS = tuple(f"<{i}>" for i in range(64))
+# Block attribute line only setting substitutions, e.g. [subs=+quotes]
+_SUBS_RE = re.compile(r"\[subs=([^\]]+)\]")
+# include:: directive, and the whole line of a directive with its attributes
+_INCLUDE_RE = re.compile(r"^include::([^\[\n]+)\[", re.MULTILINE)
+_INCLUDE_LINE_RE = re.compile(r"^include::([^\[\n]+)\[.*\].*$", re.MULTILINE)
+# Angle bracket pair in DocBook XML that may be a <key=value> placeholder.
+# Plain <name> tags are never placeholders, so they are not matched at all.
+_ANGLE_BRACKET_TAG_RE = re.compile(
+    r"<([a-zA-Z_][\w-]*(?:=[\w-]+)?\[[\w=\s\[\]<>-]*\]|[a-zA-Z_][\w-]*=[\w-]+)>"
+)
+# Entity missing its semicolon, followed by something that's not a letter
+_INCOMPLETE_ENTITY_RE = re.compile(
+    r'&(lt|gt|amp|quot|apos)(?!;|[a-zA-Z])(\s|<|>|"|\||$)'
+)
+# HTML table left in the markdown by pandoc
+_HTML_TABLE_RE = re.compile(r"<table>.*?</table>", re.DOTALL | re.IGNORECASE)
+# Pieces of the plain HTML tables pandoc usually emits, where cells only hold
+# text with the basic entities
+_HTML_TAG_NAME_RE = re.compile(r"<(/?[a-zA-Z][a-zA-Z0-9]*|!)")
+_HTML_TABLE_TAGS = frozenset(
+    ["table", "colgroup", "col", "thead", "tbody", "tr", "th", "td"]
+)
+# Attributes of a tag, only with double-quoted values
+_HTML_ATTRS = r"""(?:[ \t\n][^<>"']*(?:"[^<>"]*"[^<>"']*)*)?"""
+_HTML_SECTION_RE = re.compile(
+    rf"<(thead|tbody){_HTML_ATTRS}>(.*?)</\1>", re.DOTALL | re.IGNORECASE
+)
+_HTML_ROW_RE = re.compile(rf"<tr{_HTML_ATTRS}>(.*?)</tr>", re.DOTALL | re.IGNORECASE)
+_HTML_TEXT_CELL_RE = re.compile(
+    rf"<(t[dh]){_HTML_ATTRS}>((?:[^<&\r]|&(?:amp|lt|gt|quot|#39);)*)</\1>",
+    re.IGNORECASE,
+)
+
+# Parser for the DocBook XML generated by asciidoctor, which never loads
+# entities or anything from the network. Comments and processing
+# instructions are dropped like xml.etree.ElementTree does.
+_DOCBOOK_PARSER = etree.XMLParser(
+    resolve_entities=False, no_network=True, remove_comments=True, remove_pis=True
+)
+_DOCBOOK_NS = {"db": "http://docbook.org/ns/docbook"}
+# Table cells and titled lists in DocBook XML
+_ENTRY_XPATH = etree.XPath(".//db:entry", namespaces=_DOCBOOK_NS)
+_TITLED_LIST_XPATHS = [
+    etree.XPath(f".//db:{list_type}[db:title]", namespaces=_DOCBOOK_NS)
+    for list_type in ["itemizedlist", "orderedlist"]
+]
+# Qualified names of the DocBook elements the XML passes look at or create
+_DB_PARA_TAGS = frozenset(
+    [f"{{{_DOCBOOK_NS['db']}}}simpara", f"{{{_DOCBOOK_NS['db']}}}para"]
+)
+_DB_TITLE_TAG = f"{{{_DOCBOOK_NS['db']}}}title"
+_DB_FORMALPARA_TAG = f"{{{_DOCBOOK_NS['db']}}}formalpara"
+
+# Indicators of the language of a code block. The language with the most
+# matching indicators wins, ties go to the language listed first.
+_LANGUAGE_INDICATORS = {
+    # YAML indicators (most common in OpenStack docs)
+    "yaml": [
+        re.compile(r"^\s*\w+:\s*$", re.MULTILINE),  # Key with no value (multiline)
+        re.compile(r"^\s*\w+:\s+\S+", re.MULTILINE),  # Key: value pairs
+        re.compile(r"^\s*-\s+\w+:", re.MULTILINE),  # List items with keys
+        re.compile(r"apiVersion:"),  # Kubernetes/OpenStack CRD
+        re.compile(r"kind:"),  # Kubernetes/OpenStack CRD
+        re.compile(r"metadata:"),  # Common YAML structure
+        re.compile(r"spec:"),  # Common YAML structure
+    ],
+    # Bash/shell indicators
+    "bash": [
+        re.compile(r"^\s*#\s*!/bin/(ba)?sh", re.MULTILINE),  # Shebang
+        re.compile(r"^\s*\$\s+", re.MULTILINE),  # Command prompt
+        re.compile(  # Common commands
+            r"^\s*(sudo|export|source|echo|cd|ls|cat|grep)\s+", re.MULTILINE
+        ),
+        re.compile(r"if\s+\[.*\];\s*then"),  # Bash conditionals
+    ],
+    # INI/config file indicators
+    "ini": [
+        re.compile(r"^\s*\[[\w_-]+\]", re.MULTILINE),  # Section headers like [DEFAULT]
+        re.compile(r"^\s*[\w_-]+\s*=\s*", re.MULTILINE),  # Key = value pairs
+    ],
+    # Python indicators
+    "python": [
+        re.compile(r"^\s*import\s+", re.MULTILINE),
+        re.compile(r"^\s*from\s+\w+\s+import", re.MULTILINE),
+        re.compile(r"^\s*def\s+\w+\(", re.MULTILINE),
+        re.compile(r"^\s*class\s+\w+", re.MULTILINE),
+    ],
+    # XML indicators
+    "xml": [
+        re.compile(r"^\s*<\?xml", re.MULTILINE),
+        re.compile(r"^\s*<[\w:-]+>.*</[\w:-]+>", re.MULTILINE),
+    ],
+    # JSON indicators
+    "json": [
+        re.compile(r"^\s*[{\[]", re.MULTILINE),  # Starts with { or [
+        re.compile(r'"\w+"\s*:\s*'),  # JSON key-value
+    ],
+}
+
 
 def get_argument_parser() -> argparse.ArgumentParser:
     """Get ArgumentParser."""
@@ -91,13 +225,61 @@ def get_argument_parser() -> argparse.ArgumentParser:
         default={},
         help='JSON mapping to rename document titles (e.g., \'{"old_title": "new_title"}\')',
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        type=int,
+        default=None,
+        help="Number of documents converted in parallel (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        required=False,
+        type=float,
+        default=None,
+        help="Maximum time in seconds for each asciidoctor or pandoc command (default: no limit)",
+    )
+    parser.add_argument(
+        "-c",
+        "--cache-dir",
+        required=False,
+        type=Path,
+        default=None,
+        help="Directory to cache converted documents in, so unchanged documents "
+        "are not converted again on later runs (default: no cache)",
+    )
 
     return parser
 
 
-def get_xml_element_text(root_element: ET.Element, element_name) -> str | None:
-    """Get text stored in XML element."""
-    element = root_element.find(element_name)
+@functools.lru_cache(maxsize=256)
+def parse_version(version: str) -> Version:
+    """Parse a version string, caching the result.
+
+    All the guides of a release share the same few product numbers, so they
+    don't need to be parsed again for every docinfo.xml.
+    """
+    return Version(version)
+
+
+def get_xml_element_text(docinfo_content: bytes, element_name: str) -> str | None:
+    """Get text stored in a top level element of a parsed docinfo.xml."""
+    parser = DefusedET.XMLParser()
+    try:
+        # This is needed because docinfo.xml is not properly formatted XML file
+        # because it does not contain a single root tag. The root tag is fed
+        # separately so the content isn't copied to wrap it.
+        parser.feed(b"<root>")
+        parser.feed(docinfo_content)
+        parser.feed(b"</root>")
+        tree = parser.close()
+    except ET.ParseError as e:
+        LOG.warning(f"Can not parse docinfo.xml looking for {element_name}: {e}")
+        return None
+
+    element = tree.find(element_name)
     if element is None:
         LOG.warning(f"Can not find XML element => {element_name}")
         return None
@@ -110,6 +292,30 @@ def get_xml_element_text(root_element: ET.Element, element_name) -> str | None:
     return element_text
 
 
+def get_docinfo_element_text(
+    docinfo_content: bytes, pattern: re.Pattern, element_name: str
+) -> str | None:
+    """Get text stored in a docinfo.xml element.
+
+    docinfo.xml is not a well-formed XML document (it has no single root tag)
+    and we only need a couple of leaf elements from it, so instead of building
+    a whole tree we just extract the text with a regex. The document is only
+    parsed when the regex can't find the element.
+    """
+    match = pattern.search(docinfo_content)
+    if match is None:
+        # The element may be there with attributes or nested markup that the
+        # regex doesn't handle
+        return get_xml_element_text(docinfo_content, element_name)
+
+    element_text = match.group(1)
+    if not element_text:
+        LOG.warning(f"No text found inside of element => {element_name}")
+        return None
+
+    return html.unescape(element_text.decode("utf-8"))
+
+
 def red_hat_docs_path(
     input_dir: Path,
     output_dir: Path,
@@ -134,38 +340,58 @@ def red_hat_docs_path(
     """
     # Directories to skip (backup/old content that shouldn't be processed)
     skip_dirs = {"gerrit-backup", "backup", "old", ".backup", "archive"}
+    target_version = parse_version(docs_version)
 
-    for file in input_dir.rglob("master.adoc"):
-        # Skip files in backup/old directories
-        if any(part in skip_dirs for part in file.parts):
-            LOG.info(f"Skipping {file} (in backup/excluded directory)")
+    if any(part in skip_dirs for part in input_dir.parts):
+        LOG.info(f"Skipping {input_dir} (in backup/excluded directory)")
+        return
+
+    for dirpath, dirnames, filenames in os.walk(input_dir):
+        # Skip backup/old directories without walking their content
+        for dirname in sorted(skip_dirs.intersection(dirnames)):
+            LOG.info(f"Skipping {Path(dirpath, dirname)} (backup/excluded directory)")
+        dirnames[:] = [dirname for dirname in dirnames if dirname not in skip_dirs]
+
+        if "master.adoc" not in filenames:
             continue
+        file = Path(dirpath, "master.adoc")
 
         metadata_file_name = "docinfo.xml"
         docinfo = file.parent.joinpath(metadata_file_name)
 
-        if not docinfo.exists():
+        # os.walk already listed the directory, so there's no need to stat it
+        if metadata_file_name not in filenames:
             LOG.warning(f"{docinfo} can not be found. Skipping ...")
             continue
 
-        with open(docinfo, "r") as f:
-            # This is needed because docinfo.xml is not properly formatted XML file
-            # because it does not contain a single root tag.
-            docinfo_content = f.read()
-            tree = DefusedET.fromstring(f"<root>{docinfo_content}</root>")
+        try:
+            with open(docinfo, "rb") as f:
+                docinfo_content = f.read()
+        except FileNotFoundError:
+            # A dangling symlink is listed but can't be read
+            LOG.warning(f"{docinfo} can not be found. Skipping ...")
+            continue
 
-            productnumber = get_xml_element_text(tree, "productnumber")
-            if Version(productnumber) != Version(docs_version):
-                LOG.warning(
-                    f"{docinfo} productnumber {productnumber} != {docs_version}. Skipping ..."
-                )
-                continue
+        productnumber = get_docinfo_element_text(
+            docinfo_content, _PRODUCTNUMBER_RE, "productnumber"
+        )
+        if productnumber is None:
+            LOG.warning(f"{docinfo} productnumber is blank. Skipping ...")
+            continue
 
-            if (path_title := get_xml_element_text(tree, "title")) is None:
-                LOG.warning(f"{docinfo} title is blank. Skipping ...")
-                continue
+        if parse_version(productnumber) != target_version:
+            LOG.warning(
+                f"{docinfo} productnumber {productnumber} != {docs_version}. Skipping ..."
+            )
+            continue
+
+        if (
+            path_title := get_docinfo_element_text(docinfo_content, _TITLE_RE, "title")
+        ) is None:
+            LOG.warning(f"{docinfo} title is blank. Skipping ...")
+            continue
 
-            path_title = path_title.lower().replace(" ", "_")
+        path_title = path_title.lower().replace(" ", "_")
 
         if path_title in exclude_list:
             LOG.info(f"{path_title} is in exclude list. Skipping ...")
@@ -191,19 +417,32 @@ def red_hat_relnotes_path(
             Directory where the converted .adoc file should be stored.
     """
     ver_string = docs_version.replace(".", "-")
-    globstring = (
-        f"{ver_string}-[0-9]*/assembly_release-information-{ver_string}-[0-9]*.adoc"
-    )
-    for file in input_dir.rglob(globstring):
-        if match := re.search(rf"{ver_string}-\d+/.*-(\d+).adoc", str(file)):
-            minor_ver_string = match.group(1).replace(".", "-")
-            yield (
-                Path(file),
-                output_dir
-                / f"release-notes/{ver_string}-{minor_ver_string}{OUTPUT_FILE_EXTENSION}",
-            )
-        else:
-            LOG.warning(f"Failed to detect minor_ver of {file} with regex, skipping.")
+    dir_pattern = f"{ver_string}-[0-9]*"
+    file_pattern = f"assembly_release-information-{ver_string}-[0-9]*.adoc"
+    minor_ver_pattern = re.compile(rf"{ver_string}-\d+/.*-(\d+).adoc")
+    # Same files as input_dir.rglob(f"{dir_pattern}/{file_pattern}"), but only
+    # the release directories are listed again, instead of globbing each level
+    for dirpath, dirnames, _ in os.walk(input_dir):
+        for dirname in fnmatch.filter(dirnames, dir_pattern):
+            release_dir = Path(dirpath, dirname)
+            try:
+                release_filenames = os.listdir(release_dir)
+            except OSError:
+                # Unreadable directories are ignored, like rglob does
+                continue
+            for filename in fnmatch.filter(release_filenames, file_pattern):
+                file = release_dir / filename
+                if match := minor_ver_pattern.search(str(file)):
+                    minor_ver_string = match.group(1).replace(".", "-")
+                    yield (
+                        file,
+                        output_dir
+                        / f"release-notes/{ver_string}-{minor_ver_string}{OUTPUT_FILE_EXTENSION}",
+                    )
+                else:
+                    LOG.warning(
+                        f"Failed to detect minor_ver of {file} with regex, skipping."
+                    )
 
 
 def detect_block_language(block_lines: list[str]) -> str:
@@ -220,79 +459,14 @@ def detect_block_language(block_lines: list[str]) -> str:
     # Join lines for analysis
     content = "\n".join(block_lines)
 
-    # YAML indicators (most common in OpenStack docs)
-    yaml_indicators = [
-        r"^\s*\w+:\s*$",  # Key with no value (multiline)
-        r"^\s*\w+:\s+\S+",  # Key: value pairs
-        r"^\s*-\s+\w+:",  # List items with keys
-        r"apiVersion:",  # Kubernetes/OpenStack CRD
-        r"kind:",  # Kubernetes/OpenStack CRD
-        r"metadata:",  # Common YAML structure
-        r"spec:",  # Common YAML structure
-    ]
-
-    # Bash/shell indicators
-    bash_indicators = [
-        r"^\s*#\s*!/bin/(ba)?sh",  # Shebang
-        r"^\s*\$\s+",  # Command prompt
-        r"^\s*(sudo|export|source|echo|cd|ls|cat|grep)\s+",  # Common commands
-        r"if\s+\[.*\];\s*then",  # Bash conditionals
-    ]
-
-    # INI/config file indicators
-    ini_indicators = [
-        r"^\s*\[[\w_-]+\]",  # Section headers like [DEFAULT]
-        r"^\s*[\w_-]+\s*=\s*",  # Key = value pairs
-    ]
-
-    # Python indicators
-    python_indicators = [
-        r"^\s*import\s+",
-        r"^\s*from\s+\w+\s+import",
-        r"^\s*def\s+\w+\(",
-        r"^\s*class\s+\w+",
-    ]
-
-    # XML indicators
-    xml_indicators = [
-        r"^\s*<\?xml",
-        r"^\s*<[\w:-]+>.*</[\w:-]+>",
-    ]
-
-    # JSON indicators
-    json_indicators = [
-        r"^\s*[{\[]",  # Starts with { or [
-        r'"\w+"\s*:\s*',  # JSON key-value
-    ]
+    # None of the indicators match a block without any text
+    if not content.strip():
+        return "yaml"
 
     # Count matches for each language
     scores = {
-        "yaml": sum(
-            1
-            for pattern in yaml_indicators
-            if re.search(pattern, content, re.MULTILINE)
-        ),
-        "bash": sum(
-            1
-            for pattern in bash_indicators
-            if re.search(pattern, content, re.MULTILINE)
-        ),
-        "ini": sum(
-            1 for pattern in ini_indicators if re.search(pattern, content, re.MULTILINE)
-        ),
-        "python": sum(
-            1
-            for pattern in python_indicators
-            if re.search(pattern, content, re.MULTILINE)
-        ),
-        "xml": sum(
-            1 for pattern in xml_indicators if re.search(pattern, content, re.MULTILINE)
-        ),
-        "json": sum(
-            1
-            for pattern in json_indicators
-            if re.search(pattern, content, re.MULTILINE)
-        ),
+        language: sum(1 for pattern in indicators if pattern.search(content))
+        for language, indicators in _LANGUAGE_INDICATORS.items()
     }
 
     # Get language with highest score
@@ -322,41 +496,35 @@ def preprocess_adoc_link_brackets(
     Returns:
         Tuple of (fixed_content, list of fix descriptions)
     """
+    # Nothing to fix in documents without links
+    if "link:" not in content:
+        return content, []
+
     lines = content.split("\n")
-    new_lines = []
     fixes = []
 
-    # Pattern to match links with square brackets in the text portion
-    # link:url[text] where text contains [ or ]
-    link_pattern = re.compile(r"(link:[^\[]+\[)([^\]]*[\[\]][^\]]*?)(\])")
-
-    for i, line in enumerate(lines):
-        new_line = line
-        line_fixes = []
+    def wrap_link_text(match: re.Match) -> str:
+        link_prefix, link_text, link_suffix = match.groups()
 
-        for match in link_pattern.finditer(line):
-            link_prefix = match.group(1)
-            link_text = match.group(2)
-            link_suffix = match.group(3)
+        # Check if text contains brackets and is not already wrapped with pass:
+        if ("[" in link_text or "]" in link_text) and not link_text.startswith(
+            "pass:["
+        ):
+            # i is the index of the line being substituted below
+            fixes.append(f"Line {i + 1}: wrapped link text '{link_text}' with pass:[]")
+            # Wrap the text with pass:[]
+            return f"{link_prefix}pass:[{link_text}]{link_suffix}"
+        return match.group(0)
 
-            # Check if text contains brackets and is not already wrapped with pass:
-            if ("[" in link_text or "]" in link_text) and not link_text.startswith(
-                "pass:["
-            ):
-                # Wrap the text with pass:[]
-                new_link = f"{link_prefix}pass:[{link_text}]{link_suffix}"
-                new_line = new_line.replace(match.group(0), new_link, 1)
-                line_fixes.append(
-                    f"Line {i + 1}: wrapped link text '{link_text}' with pass:[]"
-                )
+    # Only the lines with links are replaced, the rest of the list is reused
+    for i, line in enumerate(lines):
+        if "link:" in line:
+            lines[i] = _LINK_BRACKETS_RE.sub(wrap_link_text, line)
 
-        if line_fixes:
-            fixes.extend(line_fixes)
-            new_lines.append(new_line)
-        else:
-            new_lines.append(line)
+    if not fixes:
+        return content, fixes
 
-    result = "\n".join(new_lines)
+    result = "\n".join(lines)
     return result, fixes
 
 
@@ -378,115 +546,86 @@ def preprocess_adoc_callout_numbering(
     Returns:
         Tuple of (fixed_content, list of fix descriptions)
     """
+    # Nothing to do in content without callouts
+    if not _CALLOUT_RE.search(content):
+        return content, []
+
+    # Callouts are renumbered in place, without building a new list of lines
     lines = content.split("\n")
-    renumber_map = {}  # Maps (block_index, original_number) -> new_number
-    block_callouts = []  # List of (block_index, [original_numbers_in_order])
-    block_index = 0
+    block_callouts = []  # Original callout numbers of each block, in order
+    definition_lines = []  # (line index, original number) of the definitions
     in_block = False
-    current_block_callouts = []
+    block_start = 0
+    block_map = {}  # Maps original_number -> new_number in the current block
+
+    def renumber(match: re.Match) -> str:
+        # Callouts are numbered in order of first appearance in the block
+        new_num = block_map.setdefault(int(match.group(1)), len(block_map) + 1)
+        if new_num < len(_CALLOUT_TOKENS):
+            return _CALLOUT_TOKENS[new_num]
+        return f"<{new_num}>"
 
-    # First pass: identify all callouts in blocks and build renumber map
+    # First pass: renumber callouts in blocks and find the callout definitions
     for i, line in enumerate(lines):
         if line.strip() == "----":
             if not in_block:
                 in_block = True
-                current_block_callouts = []
-                block_index += 1
+                block_start = i
+                block_map.clear()
             else:
                 in_block = False
-                if current_block_callouts:
-                    # Renumber callouts for this block starting from 1
-                    for new_num, original_num in enumerate(
-                        current_block_callouts, start=1
-                    ):
-                        renumber_map[(block_index, original_num)] = new_num
-                    block_callouts.append((block_index, list(current_block_callouts)))
+                if block_map:
+                    block_callouts.append(list(block_map))
         elif in_block:
-            # Find callouts in this line (in order of appearance)
-            for match in re.finditer(r"<(\d+)>", line):
-                original_num = int(match.group(1))
-                if original_num not in current_block_callouts:
-                    current_block_callouts.append(original_num)
+            lines[i] = _CALLOUT_RE.sub(renumber, line)
+        else:
+            match = _CALLOUT_DEFINITION_RE.match(line)
+            if match:
+                definition_lines.append((i, int(match.group(1))))
+
+    if in_block:
+        # Callouts of a block that is never closed are left as they are
+        lines[block_start + 1 :] = content.split("\n")[block_start + 1 :]
 
-    if not renumber_map:
+    if not block_callouts:
         # No callouts to renumber
         return content, []
 
-    # Second pass: apply renumbering to both block callouts and callout definitions
-    new_lines = []
-    in_block = False
-    block_index = 0
-    callout_definition_pattern = re.compile(r"^<(\d+)>\s+")
-    # Track which block's definitions we're expecting
-    definition_block_queue = list(
-        block_callouts
-    )  # Queue of (block_index, [original_nums])
-    current_definition_block = None
+    # Second pass: renumber the callout definitions, which are matched to the
+    # blocks in order
+    next_block = 0
     current_definition_callouts = []
     definition_index = 0
 
-    for i, line in enumerate(lines):
-        if line.strip() == "----":
-            if not in_block:
-                in_block = True
-                block_index += 1
-            else:
-                in_block = False
-            new_lines.append(line)
-        elif in_block:
-            # Renumber callouts in code blocks
-            new_line = line
-            for match in reversed(list(re.finditer(r"<(\d+)>", line))):
-                original_num = int(match.group(1))
-                if (block_index, original_num) in renumber_map:
-                    new_num = renumber_map[(block_index, original_num)]
-                    new_line = (
-                        new_line[: match.start()]
-                        + f"<{new_num}>"
-                        + new_line[match.end() :]
-                    )
-            new_lines.append(new_line)
-        else:
-            # Check if this is a callout definition line
-            match = callout_definition_pattern.match(line)
-            if match:
-                original_num = int(match.group(1))
-
-                # If we haven't set up the current definition block yet, or we've
-                # processed all callouts for the current block, move to the next block
-                if not current_definition_callouts and definition_block_queue:
-                    current_definition_block, current_definition_callouts = (
-                        definition_block_queue.pop(0)
-                    )
-                    definition_index = 0
-
-                # Check if this callout matches the next expected callout for current block
-                if (
-                    current_definition_callouts
-                    and definition_index < len(current_definition_callouts)
-                    and original_num == current_definition_callouts[definition_index]
-                ):
-                    # Match! Renumber it
-                    new_num = renumber_map[(current_definition_block, original_num)]
-                    new_line = callout_definition_pattern.sub(f"<{new_num}> ", line)
-                    new_lines.append(new_line)
-                    definition_index += 1
-                    # If we've processed all callouts for this block, clear it
-                    if definition_index >= len(current_definition_callouts):
-                        current_definition_callouts = []
-                        current_definition_block = None
-                        definition_index = 0
-                else:
-                    # Doesn't match expected pattern, keep original
-                    new_lines.append(line)
-            else:
-                new_lines.append(line)
+    for i, original_num in definition_lines:
+        # If we haven't set up the current definition block yet, or we've
+        # processed all callouts for the current block, move to the next block
+        if not current_definition_callouts and next_block < len(block_callouts):
+            current_definition_callouts = block_callouts[next_block]
+            next_block += 1
+            definition_index = 0
+
+        # Check if this callout matches the next expected callout for current block
+        if (
+            current_definition_callouts
+            and definition_index < len(current_definition_callouts)
+            and original_num == current_definition_callouts[definition_index]
+        ):
+            # Match! Renumber it, callouts are numbered from 1 in block order
+            lines[i] = _CALLOUT_DEFINITION_RE.sub(
+                f"<{definition_index + 1}> ", lines[i]
+            )
+            definition_index += 1
+            # If we've processed all callouts for this block, clear it
+            if definition_index >= len(current_definition_callouts):
+                current_definition_callouts = []
+                definition_index = 0
 
     # Check if content actually changed
-    new_content = "\n".join(new_lines)
+    new_content = "\n".join(lines)
     fixes = []
     if new_content != content:
-        total_callouts = len(renumber_map)
+        total_callouts = sum(len(callouts) for callouts in block_callouts)
         fixes.append(f"Renumbered {total_callouts} callout(s) with block-level scoping")
 
     return new_content, fixes
@@ -510,6 +649,10 @@ def preprocess_adoc_callout_placement(
     Returns:
         Tuple of (fixed_content, list of fix descriptions)
     """
+    # Nothing to do in content without callouts
+    if not _CALLOUT_RE.search(content):
+        return content, []
+
     lines = content.split("\n")
     fixes = []
 
@@ -532,18 +675,17 @@ def preprocess_adoc_callout_placement(
                     block_info.append((block_start, i, max_callout))
         elif in_block:
             # Find callouts in this line
-            for match in re.finditer(r"<(\d+)>", line):
+            for match in _CALLOUT_RE.finditer(line):
                 block_callouts.append(int(match.group(1)))
 
     if not block_info:
         return content, []
 
     # Second pass: collect all callout definition lines (tracking individual definitions)
-    callout_definition_pattern = re.compile(r"^<(\d+)>\s+")
     all_definitions = []  # List of (line_idx, callout_num, line_content)
 
     for i, line in enumerate(lines):
-        match = callout_definition_pattern.match(line)
+        match = _CALLOUT_DEFINITION_RE.match(line)
         if match:
             callout_num = int(match.group(1))
             all_definitions.append((i, callout_num, line))
@@ -567,10 +709,12 @@ def preprocess_adoc_callout_placement(
         while check_idx < len(lines) and len(defs_after_block) < num_defs_needed:
             # Skip empty lines and ifeval/endif lines
             line = lines[check_idx]
-            if callout_definition_pattern.match(line):
-                def_num = int(callout_definition_pattern.match(line).group(1))
+            if match := _CALLOUT_DEFINITION_RE.match(line):
+                def_num = int(match.group(1))
                 defs_after_block.append(def_num)
-            elif line.strip() and not line.strip().startswith(("ifeval::", "endif::")):
+            elif (stripped := line.strip()) and not stripped.startswith(
+                ("ifeval::", "endif::")
+            ):
                 # Hit a non-definition, non-wrapper line
                 break
             check_idx += 1
@@ -593,11 +737,12 @@ def preprocess_adoc_callout_placement(
             has_ifeval_wrapper = False
             ifeval_line = None
             for j in range(first_def_idx - 1, max(0, first_def_idx - 3), -1):
-                if lines[j].strip().startswith("ifeval::"):
+                stripped = lines[j].strip()
+                if stripped.startswith("ifeval::"):
                     has_ifeval_wrapper = True
                     ifeval_line = lines[j]
                     break
-                elif lines[j].strip():  # Hit a non-empty, non-ifeval line
+                elif stripped:  # Hit a non-empty, non-ifeval line
                     break
 
             # Collect just the definition lines we need (not the entire context)
@@ -635,12 +780,13 @@ def preprocess_adoc_callout_placement(
             j = i + 1
             while j < len(lines):
                 if j not in lines_to_skip:
-                    if lines[j].strip().startswith("endif::"):
+                    stripped = lines[j].strip()
+                    if stripped.startswith("endif::"):
                         # Empty ifeval block, mark both for removal
                         lines_to_skip.add(i)
                         lines_to_skip.add(j)
                         break
-                    elif lines[j].strip():
+                    elif stripped:
                         # Found content, keep the ifeval
                         break
                 j += 1
@@ -678,9 +824,12 @@ def preprocess_adoc_callout_spacing(
     Returns:
         Tuple of (fixed_content, list of fix descriptions)
     """
+    # Nothing to do in content without callouts
+    if not _CALLOUT_RE.search(content):
+        return content, []
+
     lines = content.split("\n")
     fixes = []
-    callout_definition_pattern = re.compile(r"^<(\d+)>\s+")
 
     # Find the end of each callout definition section and ensure blank line after
     new_lines = []
@@ -690,7 +839,7 @@ def preprocess_adoc_callout_spacing(
         new_lines.append(line)
 
         # Check if this is a callout definition
-        if callout_definition_pattern.match(line):
+        if _CALLOUT_DEFINITION_RE.match(line):
             # Found a callout definition, look for the end of this section
             j = i + 1
             last_def_line = i
@@ -699,19 +848,20 @@ def preprocess_adoc_callout_spacing(
             # (may be wrapped in ifeval/endif blocks)
             while j < len(lines):
                 current_line = lines[j]
+                current_stripped = current_line.strip()
 
-                if callout_definition_pattern.match(current_line):
+                if _CALLOUT_DEFINITION_RE.match(current_line):
                     # Another definition, update the last position
                     last_def_line = j
                     j += 1
-                elif current_line.strip().startswith("endif::"):
+                elif current_stripped.startswith("endif::"):
                     # Could be the end of an ifeval wrapper
                     last_def_line = j
                     j += 1
                     # Check if next line is another definition or ifeval
                     if j < len(lines):
                         next_line = lines[j]
-                        if callout_definition_pattern.match(
+                        if _CALLOUT_DEFINITION_RE.match(
                             next_line
                         ) or next_line.strip().startswith("ifeval::"):
                             continue
@@ -719,10 +869,10 @@ def preprocess_adoc_callout_spacing(
                             break
                     else:
                         break
-                elif current_line.strip().startswith("ifeval::"):
+                elif current_stripped.startswith("ifeval::"):
                     # Continuation of wrapped definitions
                     j += 1
-                elif current_line.strip() == "":
+                elif current_stripped == "":
                     # Empty line, we're good
                     break
                 else:
@@ -768,6 +918,10 @@ def preprocess_adoc_callouts(
     Returns:
         Tuple of (fixed_content, list of fix descriptions)
     """
+    # Nothing to do in content without callouts
+    if not _CALLOUT_RE.search(content):
+        return content, []
+
     lines = content.split("\n")
     new_lines = []
     i = 0
@@ -799,7 +953,7 @@ def preprocess_adoc_callouts(
                             has_source_designation = True
                         elif prev_line.startswith("[subs="):
                             # Extract the subs value
-                            match = re.match(r"\[subs=([^\]]+)\]", prev_line)
+                            match = _SUBS_RE.match(prev_line)
                             if match:
                                 subs_value = match.group(1)
                                 has_subs_only = True
@@ -815,7 +969,7 @@ def preprocess_adoc_callouts(
                     while j < len(lines) and lines[j].strip() != "----":
                         block_lines.append(lines[j])
                         # Check for callout pattern: <digit>
-                        if re.search(r"<\d+>", lines[j]):
+                        if _CALLOUT_RE.search(lines[j]):
                             has_callouts = True
                         j += 1
 
@@ -852,6 +1006,9 @@ class Cell:
     AI: Class generated by Cursor
     """
 
+    # Tables can have thousands of cells, avoid a __dict__ per cell
+    __slots__ = ("content", "colspan", "rowspan", "format_spec", "source_line")
+
     def __init__(
         self,
         content: str,
@@ -879,6 +1036,8 @@ class SpanPlaceholder:
     AI: Class generated by Cursor
     """
 
+    __slots__ = ("original_cell",)
+
     def __init__(self, original_cell: Cell):
         self.original_cell = original_cell
 
@@ -886,6 +1045,82 @@ class SpanPlaceholder:
         return f"Span({self.original_cell.content[:10]}...)"
 
 
+def _skip_digits(text: str, pos: int, step: int = 1) -> int:
+    """Return the position after the run of digits at pos, walking by step."""
+    if step > 0:
+        while pos < len(text) and text[pos].isdecimal():
+            pos += 1
+    else:
+        while pos > 0 and text[pos - 1].isdecimal():
+            pos -= 1
+    return pos
+
+
+def _find_cell_boundaries(line: str) -> list[int]:
+    """Find where the cells of a stripped AsciiDoc table line start.
+
+    Every boundary ends in a |, so the line is scanned from one | to the
+    next. A | starts a cell unless it follows a digit, and a span
+    specification before it (N+| or N.M+|) starts the cell at its leading
+    whitespace instead.
+
+    Args:
+        line: Stripped table line
+
+    Returns:
+        Start position of every cell, followed by the length of the line
+    """
+    boundaries = []
+    pipe = line.find("|")
+    while pipe != -1:
+        if pipe > 1 and line[pipe - 1] == "+" and line[pipe - 2].isdecimal():
+            start = _skip_digits(line, pipe - 2, -1)
+            if start > 1 and line[start - 1] == "." and line[start - 2].isdecimal():
+                start = _skip_digits(line, start - 2, -1)
+            while start > 0 and line[start - 1].isspace():
+                start -= 1
+            boundaries.append(start)
+        elif pipe == 0 or not line[pipe - 1].isdecimal():
+            boundaries.append(pipe)
+        pipe = line.find("|", pipe + 1)
+
+    # Add end of string as final boundary
+    boundaries.append(len(line))
+    return boundaries
+
+
+def _parse_cell_span(cell_text: str) -> Tuple[int, int, int]:
+    """Parse the N.M+ or N+ span specification at the start of a cell.
+
+    Args:
+        cell_text: Cell text without its leading |
+
+    Returns:
+        Tuple of (colspan, rowspan, position after the span specification)
+    """
+    digits_end = _skip_digits(cell_text, 0)
+    if not digits_end:
+        return 1, 1, 0
+
+    colspan = int(cell_text[:digits_end])
+    if cell_text.startswith(".", digits_end):
+        rowspan_end = _skip_digits(cell_text, digits_end + 1)
+        if rowspan_end > digits_end + 1 and cell_text.startswith("+", rowspan_end):
+            rowspan = int(cell_text[digits_end + 1 : rowspan_end])
+            end = rowspan_end + 1
+            if cell_text.startswith("|", end):
+                end += 1
+            return colspan, rowspan, end
+
+    if cell_text.startswith("+", digits_end):
+        end = digits_end + 1
+        if cell_text.startswith("|", end):
+            end += 1
+        return colspan, 1, end
+
+    return 1, 1, 0
+
+
 class AsciiDocTableParser:
     """Parse AsciiDoc tables into a logical grid structure and reconstruct them correctly.
 
@@ -917,7 +1152,7 @@ class AsciiDocTableParser:
 
             return fixed_lines, self.fixes_made
         except Exception as e:
-            LOG.debug(f"AST table parser failed: {e}")
+            LOG.debug("AST table parser failed: %s", e)
             return table_lines, []
 
     def extract_cells_from_lines(self, table_lines: list[str]) -> list[Cell]:
@@ -929,22 +1164,10 @@ class AsciiDocTableParser:
             if not stripped or stripped == "|===" or stripped == "|====":
                 continue
 
-            # Use regex to find all cell boundaries
             # A cell can start with:
             # 1. | followed by optional span spec (|N.M+| or |N+|) and content
             # 2. Embedded span spec like " N+|" or " N.M+|" after previous cell content
-
-            # Split by all cell boundary patterns
-            # Pattern: | OR (whitespace)(N+|) OR (whitespace)(N.M+|)
-            cell_boundary_pattern = r"(\s*\d+(?:\.\d+)?\+\||(?<!\d)\|)"
-
-            # Find all boundaries
-            boundaries = []
-            for match in re.finditer(cell_boundary_pattern, stripped):
-                boundaries.append(match.start())
-
-            # Add end of string as final boundary
-            boundaries.append(len(stripped))
+            boundaries = _find_cell_boundaries(stripped)
 
             # Extract cells between boundaries
             for idx in range(len(boundaries) - 1):
@@ -953,8 +1176,6 @@ class AsciiDocTableParser:
                 cell_text = stripped[start:end]
 
                 # Parse the cell
-                colspan = 1
-                rowspan = 1
                 format_spec = ""
                 content = ""
 
@@ -967,24 +1188,18 @@ class AsciiDocTableParser:
                 if cell_text.startswith("|"):
                     cell_text = cell_text[1:]
 
-                # Check for colspan.rowspan+ pattern
-                span_match = re.match(r"(\d+)\.(\d+)\+\|?", cell_text)
-                if span_match:
-                    colspan = int(span_match.group(1))
-                    rowspan = int(span_match.group(2))
-                    cell_text = cell_text[span_match.end() :]
-                else:
-                    # Check for colspan+ pattern
-                    colspan_match = re.match(r"(\d+)\+\|?", cell_text)
-                    if colspan_match:
-                        colspan = int(colspan_match.group(1))
-                        cell_text = cell_text[colspan_match.end() :]
+                # Check for colspan.rowspan+ or colspan+ pattern
+                colspan, rowspan, spec_end = _parse_cell_span(cell_text)
 
                 # Check for format specifier
-                format_match = re.match(r"([a-z])\|", cell_text)
-                if format_match:
-                    format_spec = format_match.group(1)
-                    cell_text = cell_text[format_match.end() :]
+                if (
+                    len(cell_text) > spec_end + 1
+                    and cell_text[spec_end + 1] == "|"
+                    and "a" <= cell_text[spec_end] <= "z"
+                ):
+                    format_spec = cell_text[spec_end]
+                    spec_end += 2
+                cell_text = cell_text[spec_end:]
 
                 # Remaining text is content
                 content = cell_text.strip()
@@ -1006,64 +1221,83 @@ class AsciiDocTableParser:
         return cells
 
     def build_grid(self, cells: list[Cell]):
-        """Build 2D grid from cells, accounting for spans."""
-        # Preallocate grid (estimate max rows)
+        """Build the grid from cells, accounting for spans.
+
+        The grid is a flat list of rows of expected_cols positions, position
+        (row, col) being at row * expected_cols + col. Rows are added as cells
+        reach them, up to len(cells) + 10 rows.
+        """
+        cols = self.expected_cols
         max_rows = len(cells) + 10
-        self.grid = [[None] * self.expected_cols for _ in range(max_rows)]
+        grid = self.grid = []
 
         row, col = 0, 0
 
         for cell in cells:
-            # Find next available position in grid
-            while row < len(self.grid):
-                while col < self.expected_cols and self.grid[row][col] is not None:
+            # Find next available position in grid, rows that were not added
+            # yet are empty
+            while row < max_rows:
+                row_start = row * cols
+                while (
+                    col < cols
+                    and row_start + col < len(grid)
+                    and grid[row_start + col] is not None
+                ):
                     col += 1
 
-                if col < self.expected_cols:
+                if col < cols:
                     break
 
                 # Move to next row
                 row += 1
                 col = 0
 
-            if row >= len(self.grid):
+            if row >= max_rows:
                 break
 
-            # Place cell and mark spanned positions
-            for r in range(row, min(row + cell.rowspan, len(self.grid))):
-                for c in range(col, min(col + cell.colspan, self.expected_cols)):
+            # Add the rows the cell spans
+            end_row = min(row + cell.rowspan, max_rows)
+            if len(grid) < end_row * cols:
+                grid.extend([None] * (end_row * cols - len(grid)))
+
+            # Place cell and mark spanned positions, which all share the
+            # same placeholder
+            placeholder = SpanPlaceholder(cell)
+            for r in range(row, end_row):
+                for c in range(col, min(col + cell.colspan, cols)):
                     if r == row and c == col:
-                        self.grid[r][c] = cell
+                        grid[r * cols + c] = cell
                     else:
-                        self.grid[r][c] = SpanPlaceholder(cell)
+                        grid[r * cols + c] = placeholder
 
             # Move to next column position
             col += cell.colspan
-            if col >= self.expected_cols:
+            if col >= cols:
                 row += 1
                 col = 0
 
         # Trim empty rows from end
-        while self.grid and all(cell is None for cell in self.grid[-1]):
-            self.grid.pop()
+        while grid and all(cell is None for cell in grid[-cols:]):
+            del grid[-cols:]
 
     def validate_and_fix_grid(self):
         """Validate each row has correct number of columns and fix issues."""
-        for row_idx, row in enumerate(self.grid):
+        for i, cell in enumerate(self.grid):
             # Check for None values (gaps in the grid)
-            for col_idx, cell in enumerate(row):
-                if cell is None:
-                    # Add empty cell
-                    row[col_idx] = Cell(content="", colspan=1, rowspan=1)
-                    self.fixes_made.append(
-                        f"Row {row_idx + 1}: Added empty cell at column {col_idx + 1}"
-                    )
+            if cell is None:
+                # Add empty cell
+                self.grid[i] = Cell(content="", colspan=1, rowspan=1)
+                row_idx, col_idx = divmod(i, self.expected_cols)
+                self.fixes_made.append(
+                    f"Row {row_idx + 1}: Added empty cell at column {col_idx + 1}"
+                )
 
     def reconstruct_table(self) -> list[str]:
         """Reconstruct valid AsciiDoc table lines from grid."""
         lines = ["|==="]
 
-        for row_idx, row in enumerate(self.grid):
+        for row_start in range(0, len(self.grid), self.expected_cols):
+            row = self.grid[row_start : row_start + self.expected_cols]
             line_parts = []
 
             for col_idx, cell in enumerate(row):
@@ -1134,57 +1368,49 @@ def merge_split_table_rows(
         Table lines with split rows merged
     """
 
-    def count_cells_simple(line: str) -> int:
-        """Quick cell count for merge detection."""
-        if not line.strip() or "|" not in line:
-            return 0
-        # Count | characters and subtract 1 for leading |
-        return line.count("|") - (1 if line.strip().startswith("|") else 0)
+    # Strip and count the cells of every line once, the lookahead below
+    # would otherwise count most lines twice
+    stripped_lines = [line.strip() for line in table_lines]
+    cell_counts = [
+        line.count("|") - (1 if stripped.startswith("|") else 0)
+        if stripped and "|" in line
+        else 0
+        for line, stripped in zip(table_lines, stripped_lines)
+    ]
 
     merged_lines = [table_lines[0]]  # Keep opening |===
+    last = len(table_lines) - 1
     i = 1
 
-    while i < len(table_lines) - 1:
+    while i < last:
         line = table_lines[i]
-        stripped = line.strip()
-
-        # Skip empty lines
-        if not stripped:
-            merged_lines.append(line)
-            i += 1
-            continue
-
-        # Count cells in this line
-        cells_in_line = count_cells_simple(line)
 
         # If this line has only 1 cell and we expect multiple columns,
-        # check if the IMMEDIATELY FOLLOWING line also has 1 cell (they form a 2-cell row)
-        # But don't merge more than 2 consecutive single-cell lines to avoid over-merging
-        if cells_in_line == 1 and expected_cols == 2 and stripped.startswith("|"):
+        # check if the IMMEDIATELY FOLLOWING line also has 1 cell (they form
+        # a 2-cell row). But don't merge more than 2 consecutive single-cell
+        # lines to avoid over-merging
+        if (
+            cell_counts[i] == 1
+            and expected_cols == 2
+            and stripped_lines[i].startswith("|")
+        ):
             # Check if next non-empty line also has exactly 1 cell
             j = i + 1
-            while j < len(table_lines) - 1 and not table_lines[j].strip():
+            while j < last and not stripped_lines[j]:
                 j += 1
 
-            if j < len(table_lines) - 1:
-                next_line = table_lines[j]
-                next_stripped = next_line.strip()
-                next_cells = count_cells_simple(next_line)
-
-                # Merge only if next line also has exactly 1 cell and starts with |
-                if next_cells == 1 and next_stripped.startswith("|"):
-                    # Merge these two lines
-                    merged_line = line.rstrip() + " " + next_line.strip()
-                    merged_lines.append(merged_line)
-                    fixes.append(
-                        f"Line {table_start_idx + i + 1}: Merged 2 split lines into single table row"
-                    )
+            # Merge only if next line also has exactly 1 cell and starts with |
+            if j < last and cell_counts[j] == 1 and stripped_lines[j].startswith("|"):
+                merged_lines.append(line.rstrip() + " " + stripped_lines[j])
+                fixes.append(
+                    f"Line {table_start_idx + i + 1}: Merged 2 split lines into single table row"
+                )
 
-                    # Skip the merged line and any empty lines we passed
-                    i = j + 1
-                    continue
+                # Skip the merged line and any empty lines we passed
+                i = j + 1
+                continue
 
-        # Default: keep line as is
+        # Default: keep line as is, empty lines included
         merged_lines.append(line)
         i += 1
 
@@ -1207,97 +1433,95 @@ def preprocess_adoc_tables(
     Returns:
         Tuple of (fixed_content, list of fix descriptions)
     """
+    # Most modules don't have any table, skip the line by line scan for them
+    if "|===" not in content:
+        if content and not content.endswith("\n"):
+            content += "\n"
+        return content, []
+
     lines = content.split("\n")
+    # Indexes of the opening and closing |=== lines, the lines outside of the
+    # tables are copied as whole slices instead of one by one
+    delimiters = [i for i, line in enumerate(lines) if line.startswith("|===")]
     new_lines = []
-    in_table = False
-    table_start_idx = -1
-    table_lines = []
     fixes = []
-
-    for i, line in enumerate(lines):
-        # Detect table start
-        if line.startswith("|==="):
-            if not in_table:
-                # Starting a new table
-                in_table = True
-                table_start_idx = len(new_lines)
-                table_lines = [line]
+    copied_until = 0
+
+    for open_idx, close_idx in zip(delimiters[::2], delimiters[1::2]):
+        new_lines.extend(lines[copied_until:open_idx])
+        copied_until = close_idx + 1
+        table_start_idx = len(new_lines)
+        table_lines = lines[open_idx:copied_until]
+
+        # Remove standalone "|" or empty lines that appear right before the closing |===
+        # These create incomplete rows. But preserve standalone "|" after the opening |===
+        # as those are valid row delimiters in AsciiDoc.
+        while len(table_lines) > 2:  # Need at least opening |===, closing |===
+            # Check lines before the closing |===
+            prev_line = table_lines[-2].strip()
+            # Only remove if it's a standalone "|" or empty line right before table close
+            # AND it's not the first line after table open (which would be index 1)
+            if (prev_line == "|" or prev_line == "") and len(table_lines) > 3:
+                # Remove this problematic line
+                removed_line = table_lines.pop(-2)
+                if removed_line.strip():  # Only log if it was non-empty
+                    fixes.append(
+                        f"Line {table_start_idx + len(table_lines)}: Removed incomplete table row: '{removed_line.strip()}'"
+                    )
             else:
-                # Ending a table
-                table_lines.append(line)
-
-                # Remove standalone "|" or empty lines that appear right before the closing |===
-                # These create incomplete rows. But preserve standalone "|" after the opening |===
-                # as those are valid row delimiters in AsciiDoc.
-                while len(table_lines) > 2:  # Need at least opening |===, closing |===
-                    # Check lines before the closing |===
-                    prev_line = table_lines[-2].strip()
-                    # Only remove if it's a standalone "|" or empty line right before table close
-                    # AND it's not the first line after table open (which would be index 1)
-                    if (prev_line == "|" or prev_line == "") and len(table_lines) > 3:
-                        # Remove this problematic line
-                        removed_line = table_lines.pop(-2)
-                        if removed_line.strip():  # Only log if it was non-empty
-                            fixes.append(
-                                f"Line {table_start_idx + len(table_lines)}: Removed incomplete table row: '{removed_line.strip()}'"
-                            )
-                    else:
-                        break
+                break
 
-                # Fix cells that start a new row after a blank line but don't have a leading |
-                # This can confuse the table parser. However, we need to be careful to only
-                # add | to the first line of a row, not to continuation lines within a cell.
-                # A line is a row start if:
-                # 1. Previous line is blank
-                # 2. The line before the blank ended with | (indicating end of a cell/row)
-                # 3. The current line doesn't start with |
-                for j in range(
-                    2, len(table_lines) - 1
-                ):  # Skip opening |=== and first line
-                    if (
-                        table_lines[j - 1].strip() == ""  # Previous line is blank
-                        and table_lines[j].strip()  # Current line has content
-                        and not table_lines[j].strip().startswith("|")
-                    ):  # Doesn't start with |
-                        # Check if the line before the blank ended with | (end of previous row)
-                        if j >= 2 and table_lines[j - 2].rstrip().endswith("|"):
-                            # This is likely a new row starting
-                            table_lines[j] = "|" + table_lines[j]
-                            fixes.append(
-                                f"Line {table_start_idx + j + 1}: Added leading '|' to row start"
-                            )
+        # Fix cells that start a new row after a blank line but don't have a leading |
+        # This can confuse the table parser. However, we need to be careful to only
+        # add | to the first line of a row, not to continuation lines within a cell.
+        # A line is a row start if:
+        # 1. Previous line is blank
+        # 2. The line before the blank ended with | (indicating end of a cell/row)
+        # 3. The current line doesn't start with |
+        # Adding a leading | doesn't change whether a line is blank or how it
+        # ends, so every line only needs to be stripped once
+        stripped = [line.strip() for line in table_lines]
+        for j in range(2, len(table_lines) - 1):  # Skip opening |=== and first line
+            if (
+                not stripped[j - 1]  # Previous line is blank
+                and stripped[j]  # Current line has content
+                and not stripped[j].startswith("|")  # Doesn't start with |
+                # The line before the blank ended with | (end of previous row)
+                and stripped[j - 2].endswith("|")
+            ):
+                # This is likely a new row starting
+                table_lines[j] = "|" + table_lines[j]
+                fixes.append(
+                    f"Line {table_start_idx + j + 1}: Added leading '|' to row start"
+                )
 
-                # Check if table has at least one body row
-                # Table structure: |===, optional header row, body rows, |===
-                # Body rows are those that contain | and are not the delimiters
-                body_rows = [
-                    line
-                    for line in table_lines[1:-1]
-                    if line.strip() and not line.startswith("|===")
-                ]
+        # Check if table has at least one body row
+        # Table structure: |===, optional header row, body rows, |===
+        # Body rows are those that contain | and are not the delimiters
+        has_body_rows = any(
+            stripped[j] and not table_lines[j].startswith("|===")
+            for j in range(1, len(table_lines) - 1)
+        )
 
-                if len(body_rows) == 0:
-                    # Empty table - add a placeholder row
-                    fixes.append(
-                        f"Line {table_start_idx}: Added placeholder row to empty table"
-                    )
-                    # Insert a placeholder row before the closing |===
-                    table_lines.insert(-1, "| N/A | N/A")
-
-                new_lines.extend(table_lines)
-                in_table = False
-                table_lines = []
-        elif in_table:
-            table_lines.append(line)
-        else:
-            new_lines.append(line)
+        if not has_body_rows:
+            # Empty table - add a placeholder row
+            fixes.append(
+                f"Line {table_start_idx}: Added placeholder row to empty table"
+            )
+            # Insert a placeholder row before the closing |===
+            table_lines.insert(-1, "| N/A | N/A")
 
-    # Handle case where table wasn't closed
-    if in_table and table_lines:
-        fixes.append(f"Line {table_start_idx}: Closed unclosed table")
-        table_lines.append("|===")
         new_lines.extend(table_lines)
 
+    # Handle case where table wasn't closed
+    if len(delimiters) % 2:
+        new_lines.extend(lines[copied_until : delimiters[-1]])
+        fixes.append(f"Line {len(new_lines)}: Closed unclosed table")
+        new_lines.extend(lines[delimiters[-1] :])
+        new_lines.append("|===")
+    else:
+        new_lines.extend(lines[copied_until:])
+
     # Join lines and ensure file ends with newline if it contained tables
     result = "\n".join(new_lines)
 
@@ -1308,13 +1532,52 @@ def preprocess_adoc_tables(
     return result, fixes
 
 
+# Source files are locked through a fixed set of shared lock files instead of
+# a .lock file created and removed next to every source file
+_LOCK_SHARDS = 64
+
+
+@functools.lru_cache(maxsize=1)
+def get_lock_dir() -> Path:
+    """Create the lock directory of the current user and check it's private.
+
+    The directory is in the shared temporary directory, so a directory that
+    another user created in advance could be used to lock us out or to plant
+    symlinks. It must be a real directory owned by the current user that no
+    one else can access.
+
+    Returns:
+        Path of the lock directory
+
+    Raises:
+        PermissionError: If the directory exists but isn't private
+    """
+    lock_dir = Path(tempfile.gettempdir()) / f"rhoso_adoc_locks-{os.getuid()}"
+    try:
+        lock_dir.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    lock_dir_stat = os.lstat(lock_dir)
+    if (
+        not stat.S_ISDIR(lock_dir_stat.st_mode)
+        or lock_dir_stat.st_uid != os.getuid()
+        or lock_dir_stat.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f"Lock directory {lock_dir} is not a private directory of the current user"
+        )
+    return lock_dir
+
+
 class FileLock:
     """Context manager for file locking to prevent concurrent modifications.
 
     AI: Class generated by Cursor
 
-    Uses fcntl-based advisory locks on Linux systems. Creates a .lock file
-    next to the target file for locking purposes.
+    Uses fcntl-based advisory locks on Linux systems. The target file is
+    mapped to one of _LOCK_SHARDS lock files in the directory returned by
+    get_lock_dir(), so two files may share a lock but a file is never
+    modified by two holders at once.
     """
 
     def __init__(
@@ -1325,49 +1588,72 @@ class FileLock:
         Args:
             file_path: Path to the file to lock
             timeout: Maximum time in seconds to wait for lock (default: 300s = 5 min)
-            check_interval: Time in seconds between lock acquisition attempts (default: 0.1s)
+            check_interval: Time in seconds between lock acquisition attempts when
+                the lock cannot be waited for with SIGALRM (default: 0.1s)
         """
         self.file_path = file_path
-        self.lock_path = file_path.parent / f".{file_path.name}.lock"
+        # crc32 rather than hash() so every process picks the same shard
+        shard = zlib.crc32(os.fsencode(file_path.resolve())) % _LOCK_SHARDS
+        self.lock_path = get_lock_dir() / f"shard_{shard}.lock"
         self.timeout = timeout
         self.check_interval = check_interval
-        self.lock_file = None
+        self.lock_fd = None
 
     def __enter__(self):
         """Acquire the file lock."""
+        # Open lock file (create if it doesn't exist), never through a symlink
+        # and without truncating it
+        self.lock_fd = os.open(
+            self.lock_path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600
+        )
+        try:
+            # Signal handlers can only be installed from the main thread
+            if threading.current_thread() is threading.main_thread():
+                self._wait_for_lock()
+            else:
+                self._poll_for_lock()
+        except BaseException:
+            os.close(self.lock_fd)
+            self.lock_fd = None
+            raise
+        LOG.debug("Acquired lock for %s", self.file_path)
+        return self
+
+    def _raise_timeout(self, signum=None, frame=None):
+        raise TimeoutError(
+            f"Could not acquire lock for {self.file_path} after {self.timeout}s"
+        )
+
+    def _wait_for_lock(self):
+        """Block in flock until the lock is released or SIGALRM fires."""
+        previous_handler = signal.signal(signal.SIGALRM, self._raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, self.timeout)
+        try:
+            fcntl.flock(self.lock_fd, fcntl.LOCK_EX)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    def _poll_for_lock(self):
+        """Retry a non-blocking flock every check_interval seconds."""
         start_time = time.time()
         while True:
             try:
-                # Open lock file (create if it doesn't exist)
-                self.lock_file = open(self.lock_path, "w")
-                # Try to acquire exclusive lock (non-blocking)
-                fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                # Successfully acquired lock
-                LOG.debug(f"Acquired lock for {self.file_path}")
-                return self
+                fcntl.flock(self.lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
             except (IOError, OSError):
                 # Lock is held by another process
                 if time.time() - start_time > self.timeout:
-                    if self.lock_file:
-                        self.lock_file.close()
-                    raise TimeoutError(
-                        f"Could not acquire lock for {self.file_path} after {self.timeout}s"
-                    )
-                # Wait and retry
+                    self._raise_timeout()
                 time.sleep(self.check_interval)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Release the file lock."""
-        if self.lock_file:
+        if self.lock_fd is not None:
             try:
-                fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
-                self.lock_file.close()
-                LOG.debug(f"Released lock for {self.file_path}")
-                # Try to remove the lock file (best effort)
-                try:
-                    self.lock_path.unlink()
-                except Exception as e:
-                    LOG.debug(f"Could not remove lock file {self.lock_path}: {e}")
+                fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+                os.close(self.lock_fd)
+                LOG.debug("Released lock for %s", self.file_path)
             except Exception as e:
                 LOG.warning(f"Error releasing lock for {self.file_path}: {e}")
 
@@ -1393,11 +1679,15 @@ def fix_adoc_file(file_path: Path) -> list[str]:
     # Acquire exclusive lock before processing the file
     with FileLock(file_path):
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                original_content = f.read()
+            original_content = file_path.read_bytes().decode("utf-8")
         except Exception as e:
             LOG.error(f"Failed to read {file_path}: {e}")
             return []
+        if "\r" in original_content:
+            # Same newline translation as reading the file in text mode
+            original_content = original_content.replace("\r\n", "\n").replace(
+                "\r", "\n"
+            )
 
         content = original_content
         all_fixes = []
@@ -1406,17 +1696,19 @@ def fix_adoc_file(file_path: Path) -> list[str]:
         content, fixes = preprocess_adoc_link_brackets(content, file_path)
         all_fixes.extend(fixes)
 
-        content, fixes = preprocess_adoc_callout_numbering(content, file_path)
-        all_fixes.extend(fixes)
+        # The callout passes don't change anything in a file without callouts
+        if _CALLOUT_RE.search(content):
+            content, fixes = preprocess_adoc_callout_numbering(content, file_path)
+            all_fixes.extend(fixes)
 
-        content, fixes = preprocess_adoc_callout_placement(content, file_path)
-        all_fixes.extend(fixes)
+            content, fixes = preprocess_adoc_callout_placement(content, file_path)
+            all_fixes.extend(fixes)
 
-        content, fixes = preprocess_adoc_callouts(content, file_path)
-        all_fixes.extend(fixes)
+            content, fixes = preprocess_adoc_callouts(content, file_path)
+            all_fixes.extend(fixes)
 
-        content, fixes = preprocess_adoc_callout_spacing(content, file_path)
-        all_fixes.extend(fixes)
+            content, fixes = preprocess_adoc_callout_spacing(content, file_path)
+            all_fixes.extend(fixes)
 
         content, fixes = preprocess_adoc_tables(content, file_path)
         all_fixes.extend(fixes)
@@ -1424,8 +1716,7 @@ def fix_adoc_file(file_path: Path) -> list[str]:
         # Only write back if changes were made
         if content != original_content:
             try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+                file_path.write_bytes(content.encode("utf-8"))
             except Exception as e:
                 LOG.error(f"Failed to write fixes to {file_path}: {e}")
                 return []
@@ -1433,13 +1724,17 @@ def fix_adoc_file(file_path: Path) -> list[str]:
         return all_fixes
 
 
-def fix_adoc_files_in_directory(base_dir: Path) -> dict[Path, list[str]]:
+def fix_adoc_files_in_directory(
+    base_dir: Path, fixed_files: set[Path] | None = None
+) -> dict[Path, list[str]]:
     """Fix all .adoc files in a directory tree.
 
     AI: Method generated by Cursor
 
     Args:
         base_dir: Base directory to search for .adoc files
+        fixed_files: Resolved paths of the files that were already fixed, which
+            are skipped. The files fixed by this call are added to it.
 
     Returns:
         Dictionary mapping file paths to lists of fix descriptions.
@@ -1448,6 +1743,14 @@ def fix_adoc_files_in_directory(base_dir: Path) -> dict[Path, list[str]]:
     fixes_by_file = {}
 
     for adoc_file in base_dir.rglob("*.adoc"):
+        # Skip the files of conversions in progress
+        if adoc_file.name.startswith(_TEMPORARY_ADOC_PREFIX):
+            continue
+        if fixed_files is not None:
+            resolved_file = adoc_file.resolve()
+            if resolved_file in fixed_files:
+                continue
+            fixed_files.add(resolved_file)
         fixes = fix_adoc_file(adoc_file)
         if fixes:
             fixes_by_file[adoc_file] = fixes
@@ -1455,7 +1758,67 @@ def fix_adoc_files_in_directory(base_dir: Path) -> dict[Path, list[str]]:
     return fixes_by_file
 
 
-def find_included_files(input_file: Path, base_dir: Path) -> set[Path]:
+def resolve_include_path(
+    include_path: str, base_dir: Path, current_file: Path
+) -> Tuple[Path, int] | None:
+    """Find the file an include directive points to.
+
+    The path is tried relative to base_dir first, then relative to the file
+    with the directive. Each candidate is checked with a single stat() call,
+    whose modification time the include caches need anyway.
+
+    Args:
+        include_path: Path given in the include directive
+        base_dir: The base directory for resolving relative includes
+        current_file: The file with the include directive
+
+    Returns:
+        Tuple of (path, modification time in nanoseconds), or None if the
+        file can't be found
+    """
+    for resolved_path in (base_dir / include_path, current_file.parent / include_path):
+        try:
+            return resolved_path, resolved_path.stat().st_mtime_ns
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def find_direct_includes(
+    file_path: Path, base_dir: Path, mtime_ns: int
+) -> Tuple[Tuple[Path, ...], bool]:
+    """Find the existing files directly included by an AsciiDoc file.
+
+    The guides of a doc tree share most of their modules, so each file is
+    only read and scanned once. The modification time is part of the key so
+    a file that is changed is scanned again.
+
+    Args:
+        file_path: The AsciiDoc file to scan
+        base_dir: The base directory for resolving relative includes
+        mtime_ns: Modification time of the file, in nanoseconds
+
+    Returns:
+        Tuple of (paths of the included files in the order they are included,
+        whether every include directive could be resolved)
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    includes = []
+    all_resolved = True
+    for match in _INCLUDE_RE.finditer(content):
+        resolved = resolve_include_path(match.group(1), base_dir, file_path)
+        if resolved is not None:
+            includes.append(resolved[0])
+        else:
+            all_resolved = False
+
+    return tuple(includes), all_resolved
+
+
+def find_included_files(input_file: Path, base_dir: Path) -> Tuple[set[Path], bool]:
     """Recursively find all files included by an AsciiDoc file.
 
     AI: Method generated by Cursor
@@ -1465,14 +1828,15 @@ def find_included_files(input_file: Path, base_dir: Path) -> set[Path]:
         base_dir: The base directory for resolving relative includes
 
     Returns:
-        Set of Path objects for all included files (recursively)
+        Tuple of (set of Path objects for all included files (recursively),
+        whether every file could be scanned and every include directive
+        resolved, e.g. includes with attribute references can't be)
     """
     included_files = set()
+    all_resolved = True
     files_to_process = [input_file]
     processed_files = set()
 
-    include_pattern = re.compile(r"^include::([^\[]+)\[")
-
     while files_to_process:
         current_file = files_to_process.pop()
 
@@ -1484,37 +1848,69 @@ def find_included_files(input_file: Path, base_dir: Path) -> set[Path]:
 
         # Read the file and find includes
         try:
-            with open(current_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            for line in content.split("\n"):
-                match = include_pattern.match(line)
-                if match:
-                    include_path = match.group(1)
-
-                    # Resolve the include path
-                    # Try relative to base_dir first
-                    resolved_path = base_dir / include_path
-                    if not resolved_path.exists():
-                        # Try relative to current file
-                        resolved_path = current_file.parent / include_path
-
-                    if resolved_path.exists():
-                        included_files.add(resolved_path)
-                        files_to_process.append(resolved_path)
+            direct_includes, direct_resolved = find_direct_includes(
+                current_file, base_dir, current_file.stat().st_mtime_ns
+            )
+            included_files.update(direct_includes)
+            files_to_process.extend(direct_includes)
+            all_resolved = all_resolved and direct_resolved
         except Exception as e:
             LOG.warning(f"Failed to process includes in {current_file}: {e}")
+            all_resolved = False
 
-    return included_files
+    return included_files, all_resolved
 
 
-def resolve_adoc_includes(content: str, base_dir: Path, current_file: Path) -> str:
-    """Recursively resolve AsciiDoc include directives.
-
-    AI: Method generated by Cursor
+def find_docinfo_files(input_path: Path, base_dir: Path) -> list[Path]:
+    """Find the docinfo files asciidoctor may embed in a document.
 
-    Reads and inlines all include:: directives to create a single document
-    that can be preprocessed as a whole.
+    The docbook5 backend embeds docinfo.xml, docinfo-footer.xml and
+    <docname>-docinfo*.xml from the document directory when the document
+    sets :docinfo:. The base directory is looked at too, since that's where
+    the wrapper including the attributes file is converted from.
+
+    Args:
+        input_path: The AsciiDoc file being converted
+        base_dir: The base directory of the document
+
+    Returns:
+        Sorted paths of the docinfo files found
+    """
+    docinfo_files = set()
+    for directory in {input_path.parent, base_dir}:
+        for pattern in ("docinfo*.xml", f"{input_path.stem}-docinfo*.xml"):
+            docinfo_files.update(directory.glob(pattern))
+    return sorted(docinfo_files)
+
+
+@functools.lru_cache(maxsize=4096)
+def read_included_file(file_path: Path, mtime_ns: int) -> str:
+    """Read an included file, caching its content.
+
+    The same snippets (attributes, legal notices, ...) are included from many
+    assemblies, so they are only read once. The modification time is part of
+    the key so a file that is changed is read again. Only the raw content is
+    cached: the files it includes are resolved on every use, so a change to
+    a nested include is never hidden by the cache.
+
+    Args:
+        file_path: Path to the included file
+        mtime_ns: Modification time of the file, in nanoseconds
+
+    Returns:
+        Content of the file
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def resolve_adoc_includes(content: str, base_dir: Path, current_file: Path) -> str:
+    """Recursively resolve AsciiDoc include directives.
+
+    AI: Method generated by Cursor
+
+    Reads and inlines all include:: directives to create a single document
+    that can be preprocessed as a whole.
 
     Args:
         content: The AsciiDoc content with include directives
@@ -1524,46 +1920,33 @@ def resolve_adoc_includes(content: str, base_dir: Path, current_file: Path) -> s
     Returns:
         Content with all includes resolved inline
     """
-    lines = content.split("\n")
-    new_lines = []
-    include_pattern = re.compile(r"^include::([^\[]+)\[(.*)\]")
-
-    for line in lines:
-        match = include_pattern.match(line)
-        if match:
-            include_path = match.group(1)
 
-            # Resolve the include path
-            # Try relative to base_dir first
-            resolved_path = base_dir / include_path
-            if not resolved_path.exists():
-                # Try relative to current file
-                resolved_path = current_file.parent / include_path
+    def inline_include(match: re.Match) -> str:
+        include_path = match.group(1)
 
-            if resolved_path.exists():
-                try:
-                    with open(resolved_path, "r", encoding="utf-8") as f:
-                        included_content = f.read()
+        resolved = resolve_include_path(include_path, base_dir, current_file)
+        if resolved is None:
+            LOG.warning(f"Include file not found: {include_path}")
+            return match.group(0)  # Keep original include directive
+        resolved_path, mtime_ns = resolved
 
-                    # Recursively resolve includes in the included file
-                    included_content = resolve_adoc_includes(
-                        included_content, base_dir, resolved_path
-                    )
+        try:
+            # Recursively resolve includes in the included file
+            included_content = resolve_adoc_includes(
+                read_included_file(resolved_path, mtime_ns), base_dir, resolved_path
+            )
+        except Exception as e:
+            LOG.warning(f"Failed to read include {include_path}: {e}")
+            return match.group(0)  # Keep original include directive
 
-                    # Add a comment to track where this content came from
-                    new_lines.append(f"// BEGIN INCLUDE: {include_path}")
-                    new_lines.append(included_content)
-                    new_lines.append(f"// END INCLUDE: {include_path}")
-                except Exception as e:
-                    LOG.warning(f"Failed to read include {include_path}: {e}")
-                    new_lines.append(line)  # Keep original include directive
-            else:
-                LOG.warning(f"Include file not found: {include_path}")
-                new_lines.append(line)  # Keep original include directive
-        else:
-            new_lines.append(line)
+        # Add a comment to track where this content came from
+        return (
+            f"// BEGIN INCLUDE: {include_path}\n"
+            f"{included_content}\n"
+            f"// END INCLUDE: {include_path}"
+        )
 
-    return "\n".join(new_lines)
+    return _INCLUDE_LINE_RE.sub(inline_include, content)
 
 
 def find_adoc_base_dir(input_path: Path) -> Path:
@@ -1581,7 +1964,17 @@ def find_adoc_base_dir(input_path: Path) -> Path:
     Returns:
         The base directory path for resolving includes
     """
-    current = input_path.parent
+    return _find_adoc_base_dir_from(input_path.parent)
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_adoc_base_dir_from(start_dir: Path) -> Path:
+    """Walk up from start_dir to the AsciiDoc base directory, caching the result.
+
+    All the files of a guide live in a handful of directories, so the
+    markers are only looked up once per directory.
+    """
+    current = start_dir
 
     # Walk up the directory tree looking for common doc directories
     for _ in range(5):  # Limit search depth to avoid going too far up
@@ -1599,7 +1992,7 @@ def find_adoc_base_dir(input_path: Path) -> Path:
 
     # If we didn't find a suitable base directory, use the input file's parent
     # (this is the fallback for simple cases)
-    return input_path.parent
+    return start_dir
 
 
 def preprocess_xml_escape_angle_brackets(xml_content: str) -> str:
@@ -1632,7 +2025,17 @@ def preprocess_xml_escape_angle_brackets(xml_content: str) -> str:
         # Indicators of placeholders:
         # - Contains = with no space before it and no proper attribute syntax
         # - Pattern: word=word (like key=value)
-        if re.match(r"^[a-zA-Z_][\w-]*=[^\s>]+$", tag_content):
+        # The tag pattern already guarantees a leading name, so only check
+        # that the first "=" comes before any [...] suffix and that no
+        # whitespace or ">" follows it
+        eq = tag_content.find("=")
+        value = tag_content[eq + 1 :]
+        if (
+            eq > 0
+            and "[" not in tag_content[:eq]
+            and ">" not in value
+            and value.split() == [value]
+        ):
             # This looks like <key=value> style placeholder
             fixes_applied += 1
             return f"&lt;{tag_content}&gt;"
@@ -1645,18 +2048,47 @@ def preprocess_xml_escape_angle_brackets(xml_content: str) -> str:
     # - Closing tags </...>
     # - Self-closing tags <.../>
     # - Processing instructions
-    result = re.sub(
-        r"<([a-zA-Z_][\w-]*(?:=[\w-]+)?(?:\[[\w=\s\[\]<>-]*\])?)>",
-        escape_invalid_tags,
-        xml_content,
-    )
+    result = _ANGLE_BRACKET_TAG_RE.sub(escape_invalid_tags, xml_content)
 
     if fixes_applied > 0:
-        LOG.info(f"Escaped {fixes_applied} invalid XML angle bracket(s)")
+        LOG.debug("Escaped %s invalid XML angle bracket(s)", fixes_applied)
 
     return result
 
 
+# Map of undefined entities to their replacements
+# Using numeric entities or actual characters that are XML-safe
+_UNDEFINED_ENTITIES = {
+    "&verbar;": "&#124;",  # Vertical bar |
+    "&vert;": "&#124;",  # Alternative vertical bar
+    "&lsqb;": "&#91;",  # Left square bracket [
+    "&rsqb;": "&#93;",  # Right square bracket ]
+    "&lcub;": "&#123;",  # Left curly brace {
+    "&rcub;": "&#125;",  # Right curly brace }
+    "&sol;": "&#47;",  # Solidus /
+    "&bsol;": "&#92;",  # Reverse solidus \
+    "&comma;": "&#44;",  # Comma ,
+    "&period;": "&#46;",  # Period .
+    "&colon;": "&#58;",  # Colon :
+    "&semi;": "&#59;",  # Semicolon ;
+    "&equals;": "&#61;",  # Equals sign =
+    "&plus;": "&#43;",  # Plus sign +
+    "&ast;": "&#42;",  # Asterisk *
+    "&num;": "&#35;",  # Number sign #
+    "&percnt;": "&#37;",  # Percent sign %
+    "&dollar;": "&#36;",  # Dollar sign $
+    "&commat;": "&#64;",  # Commercial at @
+    "&excl;": "&#33;",  # Exclamation mark !
+    "&quest;": "&#63;",  # Question mark ?
+    "&grave;": "&#96;",  # Grave accent `
+    "&Hat;": "&#94;",  # Circumflex accent ^
+    "&tilde;": "&#126;",  # Tilde ~
+}
+_UNDEFINED_ENTITY_RE = re.compile(
+    "|".join(re.escape(entity) for entity in _UNDEFINED_ENTITIES)
+)
+
+
 def preprocess_xml_undefined_entities(xml_content: str) -> str:
     """Replace undefined XML entities with their proper representations.
 
@@ -1671,40 +2103,18 @@ def preprocess_xml_undefined_entities(xml_content: str) -> str:
     Returns:
         XML content with undefined entities replaced
     """
-    # Map of undefined entities to their replacements
-    # Using numeric entities or actual characters that are XML-safe
-    entity_replacements = {
-        "&verbar;": "&#124;",  # Vertical bar |
-        "&vert;": "&#124;",  # Alternative vertical bar
-        "&lsqb;": "&#91;",  # Left square bracket [
-        "&rsqb;": "&#93;",  # Right square bracket ]
-        "&lcub;": "&#123;",  # Left curly brace {
-        "&rcub;": "&#125;",  # Right curly brace }
-        "&sol;": "&#47;",  # Solidus /
-        "&bsol;": "&#92;",  # Reverse solidus \
-        "&comma;": "&#44;",  # Comma ,
-        "&period;": "&#46;",  # Period .
-        "&colon;": "&#58;",  # Colon :
-        "&semi;": "&#59;",  # Semicolon ;
-        "&equals;": "&#61;",  # Equals sign =
-        "&plus;": "&#43;",  # Plus sign +
-        "&ast;": "&#42;",  # Asterisk *
-        "&num;": "&#35;",  # Number sign #
-        "&percnt;": "&#37;",  # Percent sign %
-        "&dollar;": "&#36;",  # Dollar sign $
-        "&commat;": "&#64;",  # Commercial at @
-        "&excl;": "&#33;",  # Exclamation mark !
-        "&quest;": "&#63;",  # Question mark ?
-        "&grave;": "&#96;",  # Grave accent `
-        "&Hat;": "&#94;",  # Circumflex accent ^
-        "&tilde;": "&#126;",  # Tilde ~
-    }
+    found_entities = set()
 
-    # Replace each undefined entity
-    for entity, replacement in entity_replacements.items():
-        if entity in xml_content:
-            xml_content = xml_content.replace(entity, replacement)
-            LOG.debug(f"Replaced {entity} with {replacement}")
+    def replace_entity(match: re.Match) -> str:
+        found_entities.add(match.group(0))
+        return _UNDEFINED_ENTITIES[match.group(0)]
+
+    # Replace all the undefined entities in a single scan
+    xml_content = _UNDEFINED_ENTITY_RE.sub(replace_entity, xml_content)
+    if found_entities and LOG.isEnabledFor(logging.DEBUG):
+        for entity, replacement in _UNDEFINED_ENTITIES.items():
+            if entity in found_entities:
+                LOG.debug("Replaced %s with %s", entity, replacement)
 
     # Fix incomplete HTML/XML entities that are missing the closing semicolon
     # This handles cases where &lt, &gt, &amp, &quot, &apos appear without semicolons
@@ -1721,12 +2131,57 @@ def preprocess_xml_undefined_entities(xml_content: str) -> str:
 
     # Match &(lt|gt|amp|quot|apos) followed by something that's not a semicolon or letter
     # This ensures we don't break &ltfoo; into &lt;foo;
-    pattern = r'&(lt|gt|amp|quot|apos)(?!;|[a-zA-Z])(\s|<|>|"|\||$)'
-    xml_content = re.sub(pattern, fix_incomplete_entity, xml_content)
+    xml_content = _INCOMPLETE_ENTITY_RE.sub(fix_incomplete_entity, xml_content)
 
     return xml_content
 
 
+def _simple_html_table_rows(
+    html_table: str,
+) -> Tuple[list[list[str]], list[list[str]]] | None:
+    """Extract the header and body rows of a plain HTML table with regexes.
+
+    Args:
+        html_table: An HTML table matched by _HTML_TABLE_RE
+
+    Returns:
+        Tuple of (header rows, body rows) with the text of each cell, or None
+        if the table has markup other than plain text cells and has to be
+        parsed as HTML
+    """
+    tag_names = [name.lower() for name in _HTML_TAG_NAME_RE.findall(html_table)]
+    if not _HTML_TABLE_TAGS.issuperset(name.lstrip("/") for name in tag_names):
+        return None
+    if tag_names.count("table") != 1:
+        return None
+
+    rows_by_section: dict[str, list[list[str]]] = {"thead": [], "tbody": []}
+    section_count = row_count = cell_count = 0
+    for section, section_content in _HTML_SECTION_RE.findall(html_table):
+        section_count += 1
+        for row_content in _HTML_ROW_RE.findall(section_content):
+            row_count += 1
+            cells = [
+                html.unescape(text).strip()
+                for _, text in _HTML_TEXT_CELL_RE.findall(row_content)
+            ]
+            cell_count += len(cells)
+            rows_by_section[section.lower()].append(cells)
+
+    # Every section, row and cell of the table must have been matched with
+    # its closing tag, otherwise the HTML parser may see a different table
+    for count, names in (
+        (section_count, ("thead", "tbody")),
+        (row_count, ("tr",)),
+        (cell_count, ("th", "td")),
+    ):
+        if count != sum(map(tag_names.count, names)):
+            return None
+        if count != sum(tag_names.count(f"/{name}") for name in names):
+            return None
+    return rows_by_section["thead"], rows_by_section["tbody"]
+
+
 def convert_html_tables_to_markdown(markdown_content: str) -> str:
     """Convert HTML tables in markdown to pipe tables.
 
@@ -1741,87 +2196,42 @@ def convert_html_tables_to_markdown(markdown_content: str) -> str:
     Returns:
         Markdown content with HTML tables converted to pipe tables
     """
-    from html.parser import HTMLParser
-
-    class TableParser(HTMLParser):
-        def __init__(self):
-            super().__init__()
-            self.in_table = False
-            self.in_thead = False
-            self.in_tbody = False
-            self.in_row = False
-            self.in_cell = False
-            self.current_cell = []
-            self.current_row = []
-            self.headers = []
-            self.rows = []
-            self.table_start = -1
-            self.table_end = -1
-
-        def handle_starttag(self, tag, attrs):
-            if tag == "table":
-                self.in_table = True
-                self.headers = []
-                self.rows = []
-            elif tag == "thead":
-                self.in_thead = True
-            elif tag == "tbody":
-                self.in_tbody = True
-            elif tag == "tr":
-                self.in_row = True
-                self.current_row = []
-            elif tag in ("th", "td"):
-                self.in_cell = True
-                self.current_cell = []
-
-        def handle_endtag(self, tag):
-            if tag == "table":
-                self.in_table = False
-            elif tag == "thead":
-                self.in_thead = False
-            elif tag == "tbody":
-                self.in_tbody = False
-            elif tag == "tr":
-                self.in_row = False
-                if self.in_thead:
-                    self.headers.append(self.current_row[:])
-                elif self.in_tbody:
-                    self.rows.append(self.current_row[:])
-                self.current_row = []
-            elif tag in ("th", "td"):
-                self.in_cell = False
-                cell_text = " ".join(self.current_cell).strip()
-                self.current_row.append(cell_text)
-                self.current_cell = []
-
-        def handle_data(self, data):
-            if self.in_cell:
-                self.current_cell.append(data.strip())
 
-    # Find all HTML tables
-    table_pattern = re.compile(r"<table>.*?</table>", re.DOTALL | re.IGNORECASE)
+    def cell_text(cell: etree._Element) -> str:
+        # Text of the cell and its inline elements, each piece stripped
+        return " ".join(text.strip() for text in cell.itertext()).strip()
 
     def replace_table(match):
         html_table = match.group(0)
-        parser = TableParser()
         try:
-            parser.feed(html_table)
+            simple_rows = _simple_html_table_rows(html_table)
+            if simple_rows is not None:
+                headers, rows = simple_rows
+            else:
+                table = lxml_html.fragment_fromstring(html_table)
+                headers = [
+                    [cell_text(cell) for cell in row.iter("th", "td")]
+                    for row in table.iterfind(".//thead//tr")
+                ]
+                rows = [
+                    [cell_text(cell) for cell in row.iter("th", "td")]
+                    for row in table.iterfind(".//tbody//tr")
+                ]
 
-            if not parser.headers and not parser.rows:
+            if not headers and not rows:
                 return html_table  # Could not parse, keep original
 
             # Build markdown table
             md_lines = []
 
             # Headers
-            if parser.headers:
-                for header_row in parser.headers:
-                    md_lines.append("| " + " | ".join(header_row) + " |")
-                    # Separator row
-                    md_lines.append("|" + "|".join(["---" for _ in header_row]) + "|")
+            for header_row in headers:
+                md_lines.append("| " + " | ".join(header_row) + " |")
+                # Separator row
+                md_lines.append("|" + "|".join(["---" for _ in header_row]) + "|")
 
             # Body rows
-            for row in parser.rows:
+            for row in rows:
                 md_lines.append("| " + " | ".join(row) + " |")
 
             return "\n".join(md_lines)
@@ -1829,10 +2239,66 @@ def convert_html_tables_to_markdown(markdown_content: str) -> str:
             LOG.warning(f"Failed to convert HTML table to markdown: {e}")
             return html_table  # Keep original on error
 
-    result = table_pattern.sub(replace_table, markdown_content)
+    # Find all HTML tables
+    result = _HTML_TABLE_RE.sub(replace_table, markdown_content)
     return result
 
 
+def _flatten_table_cells(root: etree._Element) -> None:
+    """Unwrap the single simpara/para child of the entry elements of a tree."""
+    # Find all entry elements
+    for entry in _ENTRY_XPATH(root):
+        # Check if the entry has exactly one child and it's a simpara or para
+        if len(entry) == 1 and entry[0].tag in _DB_PARA_TAGS:
+            para_elem = entry[0]
+
+            # Move the para element's text to the entry
+            if para_elem.text:
+                entry.text = (entry.text or "") + para_elem.text
+
+            # Move all children of para to entry, most cells only have text
+            if len(para_elem):
+                entry.extend(para_elem[:])
+
+            # Move the para element's tail (text after the element) to the last child or entry
+            if para_elem.tail:
+                if len(entry) > 1:  # If there are children now
+                    last_child = entry[-1]
+                    last_child.tail = (last_child.tail or "") + para_elem.tail
+                else:
+                    entry.text = (entry.text or "") + para_elem.tail
+
+            # Remove the para element
+            entry.remove(para_elem)
+
+
+def _convert_list_titles(root: etree._Element) -> None:
+    """Move the titles of the lists of a tree to a formalpara before them."""
+    # Find all itemizedlist and orderedlist elements with title children
+    for titled_list_xpath in _TITLED_LIST_XPATHS:
+        for list_elem in titled_list_xpath(root):
+            title_elem = list_elem.find(_DB_TITLE_TAG)
+            if title_elem is not None:
+                # Get the parent of the list
+                parent = list_elem.getparent()
+                if parent is not None:
+                    # Get the index of the list in its parent
+                    list_index = parent.index(list_elem)
+
+                    # Remove the title from the list
+                    list_elem.remove(title_elem)
+
+                    # Create a formalpara element with the title
+                    formalpara = etree.Element(_DB_FORMALPARA_TAG)
+                    # Move the title to the formalpara
+                    formalpara.append(title_elem)
+                    # Add an empty para as formalpara requires it
+                    # para = etree.SubElement(formalpara, f'{{{ns["db"]}}}para')
+
+                    # Insert the formalpara before the list
+                    parent.insert(list_index, formalpara)
+
+
 def preprocess_xml_table_cells(xml_content: str) -> str:
     """Flatten table cell content to inline elements for pipe table compatibility.
 
@@ -1851,42 +2317,12 @@ def preprocess_xml_table_cells(xml_content: str) -> str:
     """
     try:
         # Parse the XML
-        root = DefusedET.fromstring(xml_content)
-
-        # Define the DocBook namespace
-        ns = {"db": "http://docbook.org/ns/docbook"}
-
-        # Find all entry elements
-        for entry in root.findall(f".//{{{ns['db']}}}entry"):
-            # Check if the entry has exactly one child and it's a simpara or para
-            children = list(entry)
-            if len(children) == 1 and children[0].tag in (
-                f"{{{ns['db']}}}simpara",
-                f"{{{ns['db']}}}para",
-            ):
-                para_elem = children[0]
-
-                # Move the para element's text to the entry
-                if para_elem.text:
-                    entry.text = (entry.text or "") + para_elem.text
+        root = etree.fromstring(xml_content.encode("utf-8"), _DOCBOOK_PARSER)
 
-                # Move all children of para to entry
-                for child in list(para_elem):
-                    entry.append(child)
-
-                # Move the para element's tail (text after the element) to the last child or entry
-                if para_elem.tail:
-                    if len(entry) > 1:  # If there are children now
-                        last_child = list(entry)[-1]
-                        last_child.tail = (last_child.tail or "") + para_elem.tail
-                    else:
-                        entry.text = (entry.text or "") + para_elem.tail
-
-                # Remove the para element
-                entry.remove(para_elem)
+        _flatten_table_cells(root)
 
         # Convert back to string
-        return ET.tostring(root, encoding="unicode")
+        return etree.tostring(root, encoding="unicode")
     except Exception as e:
         LOG.warning(f"Failed to preprocess XML table cells: {e}")
         # Return original content if preprocessing fails
@@ -1912,49 +2348,173 @@ def preprocess_xml_list_titles(xml_content: str) -> str:
     """
     try:
         # Parse the XML
-        root = DefusedET.fromstring(xml_content)
-
-        # Define the DocBook namespace
-        ns = {"db": "http://docbook.org/ns/docbook"}
-
-        # Find all itemizedlist and orderedlist elements with title children
-        for list_type in ["itemizedlist", "orderedlist"]:
-            for list_elem in root.findall(f".//{{{ns['db']}}}{list_type}", ns):
-                # Check if it has a title child
-                title_elem = list_elem.find(f"{{{ns['db']}}}title", ns)
-                if title_elem is not None:
-                    # Get the parent of the list
-                    parent = None
-                    for potential_parent in root.iter():
-                        if list_elem in potential_parent:
-                            parent = potential_parent
-                            break
+        root = etree.fromstring(xml_content.encode("utf-8"), _DOCBOOK_PARSER)
+
+        _convert_list_titles(root)
+
+        # Convert back to string
+        return etree.tostring(root, encoding="unicode")
+    except Exception as e:
+        LOG.warning(f"Failed to preprocess XML list titles: {e}")
+        # Return original content if preprocessing fails
+        return xml_content
 
-                    if parent is not None:
-                        # Get the index of the list in its parent
-                        list_index = list(parent).index(list_elem)
 
-                        # Remove the title from the list
-                        list_elem.remove(title_elem)
+def preprocess_xml_table_cells_and_list_titles(xml_content: str) -> str:
+    """Flatten table cells and convert list titles with a single parse.
 
-                        # Create a formalpara element with the title
-                        formalpara = ET.Element(f"{{{ns['db']}}}formalpara")
-                        # Move the title to the formalpara
-                        formalpara.append(title_elem)
-                        # Add an empty para as formalpara requires it
-                        # para = ET.SubElement(formalpara, f'{{{ns["db"]}}}para')
+    Same as preprocess_xml_table_cells() followed by
+    preprocess_xml_list_titles(), but the XML is only parsed and serialized
+    once.
+
+    Args:
+        xml_content: The DocBook XML content as a string
+
+    Returns:
+        Preprocessed XML with flattened table cells and list titles
+        converted to formalpara
+    """
+    try:
+        # Parse the XML
+        root = etree.fromstring(xml_content.encode("utf-8"), _DOCBOOK_PARSER)
 
-                        # Insert the formalpara before the list
-                        parent.insert(list_index, formalpara)
+        _flatten_table_cells(root)
+        _convert_list_titles(root)
 
         # Convert back to string
-        return ET.tostring(root, encoding="unicode")
+        return etree.tostring(root, encoding="unicode")
     except Exception as e:
-        LOG.warning(f"Failed to preprocess XML list titles: {e}")
+        LOG.warning(f"Failed to preprocess XML table cells and list titles: {e}")
         # Return original content if preprocessing fails
         return xml_content
 
 
+def write_temporary_adoc(content: str, directory: str) -> Path:
+    """Write AsciiDoc content to a new temporary file.
+
+    The file has to be created in the doc tree, not in /tmp/, for asciidoctor
+    to resolve the relative includes it has like the original file.
+
+    Args:
+        content: The AsciiDoc content to write
+        directory: Absolute path of the directory to create the file in
+
+    Returns:
+        Path of the file, which the caller must remove
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        prefix=_TEMPORARY_ADOC_PREFIX,
+        suffix=".adoc",
+        dir=directory,
+        delete=False,
+        encoding="utf-8",
+    ) as temp_file:
+        temp_path = Path(temp_file.name)
+        try:
+            temp_file.write(content)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+    return temp_path
+
+
+@functools.lru_cache(maxsize=4096)
+def file_digest(file_path: Path, mtime_ns: int) -> bytes:
+    """Hash the content of a file, caching the result.
+
+    The modification time is part of the key so a file that is changed is
+    hashed again.
+    """
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").digest()
+
+
+def get_tool_versions(timeout: float | None = None) -> bytes | None:
+    """Get the versions of asciidoctor and pandoc, to key cached conversions on.
+
+    Called once per run, in the main process, since each call starts Ruby.
+
+    Args:
+        timeout: Maximum time in seconds for each version command, if any
+
+    Returns:
+        Output of the version commands of the tools, or None if a tool
+        couldn't report its version
+    """
+    try:
+        return b"".join(
+            subprocess.run(  # noqa: S603
+                [tool, "--version"],
+                check=True,
+                capture_output=True,
+                timeout=timeout,
+            ).stdout
+            for tool in ("asciidoctor", "pandoc")
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        LOG.warning(f"Failed to get the tool versions, not caching: {e}")
+        return None
+
+
+class ConversionCache:
+    """Cache of converted documents, keyed on everything they are built from.
+
+    The key covers the input file, the files it includes, the attributes
+    file, this script, the pandoc filters and the versions of asciidoctor and
+    pandoc.
+    """
+
+    def __init__(self, cache_dir: Path, tool_versions: bytes | None):
+        # The directory is created by the main process before the workers
+        # start
+        self.cache_dir = cache_dir
+        # Output of the version commands of the tools, from get_tool_versions().
+        # None if a tool couldn't report its version, nothing is cached then.
+        self.tool_versions = tool_versions
+
+    def key(self, source_files: list[Path]) -> str | None:
+        """Build the cache key of a conversion.
+
+        Args:
+            source_files: Files the conversion reads, including this script
+                and the filters
+
+        Returns:
+            Hex digest identifying the conversion, or None if the tool
+            versions are unknown and the conversion mustn't be cached
+        """
+        if self.tool_versions is None:
+            return None
+        key_hash = hashlib.blake2b()
+        key_hash.update(self.tool_versions)
+        for source_file in source_files:
+            key_hash.update(str(source_file.absolute()).encode("utf-8") + b"\0")
+            key_hash.update(file_digest(source_file, source_file.stat().st_mtime_ns))
+        return key_hash.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get the markdown of a cached conversion, or None if it isn't cached."""
+        try:
+            return (self.cache_dir / f"{key}.md").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, markdown_content: str) -> None:
+        """Store the markdown of a conversion.
+
+        The file is written under a temporary name and renamed, so other
+        workers never read a partially written entry.
+        """
+        temp_path = self.cache_dir / f"{key}.{os.getpid()}.tmp"
+        try:
+            temp_path.write_text(markdown_content, encoding="utf-8")
+            os.replace(temp_path, self.cache_dir / f"{key}.md")
+        except OSError as e:
+            LOG.warning(f"Failed to cache conversion {key}: {e}")
+            temp_path.unlink(missing_ok=True)
+
+
 class RelNotesConverter:
     """Convert AsciiDoc release notes to Markdown using asciidoctor and pandoc."""
 
@@ -1968,62 +2528,100 @@ class RelNotesConverter:
         Path(__file__).parent / "filters/fix-codeblock-tables.lua"
     ).absolute()
 
-    def __init__(self, attributes_file: Path | None = None):
+    def __init__(
+        self,
+        attributes_file: Path | None = None,
+        timeout: float | None = None,
+        cache: ConversionCache | None = None,
+    ):
         self.attributes_file = attributes_file
-
-    def convert(self, input_path: Path, output_path: Path) -> dict[Path, list[str]]:
-        """Convert release notes from AsciiDoc to Markdown.
-
-        This method uses a multi-step conversion process:
-        1. Fix all AsciiDoc source files in the base directory
-        2. Convert AsciiDoc to DocBook5 XML using asciidoctor
-        3. Convert DocBook5 XML to Markdown using pandoc with a custom filter
-
-        We chose this process because it uses standard tools (even if they have
-        bugs/limitations) and this process was recommended by our docs team.
-
-        The source documentation is not 100% conformant with the AsciiDoc spec,
-        this creates a problem with the process, and we chose to fix the source
-        documents instead of creating temporary files and fix includes as well
-        as it simplifies the code, speeds later runs, and allows for an easier
-        diff to see what has changed.
+        # Maximum time in seconds for each external command, so a hung
+        # conversion doesn't stall the whole batch
+        self.timeout = timeout
+        self.cache = cache
+        # The pandoc command is the same for every document
+        self.pandoc_cmd = [
+            "pandoc",
+            "-f",
+            "docbook",
+            "--wrap=preserve",
+            "-t",
+            "markdown-simple_tables-multiline_tables-grid_tables+pipe_tables",
+            f"--filter={self.PANDOC_FILTER_PATH}",
+            f"--lua-filter={self.PANDOC_LUA_FILTER_PATH}",
+            f"--lua-filter={self.PANDOC_LUA_CODEBLOCK_FIX_PATH}",
+        ]
+
+    def cache_key(
+        self,
+        input_path: Path,
+        base_dir: Path,
+        included_files: set[Path],
+        includes_resolved: bool,
+    ) -> str | None:
+        """Build the cache key of a conversion.
+
+        The key covers every file asciidoctor reads: the document, its
+        includes, the attributes file and its own includes, and the docinfo
+        files.
+
+        Returns None, so the document is converted and not cached, if there's
+        no cache or if some includes couldn't be resolved: the files they
+        point to would be missing from the key.
+        """
+        if self.cache is None or not includes_resolved:
+            return None
+        source_files = [Path(__file__), input_path, *sorted(included_files)]
+        if self.attributes_file:
+            attributes_includes, attributes_resolved = find_included_files(
+                self.attributes_file, base_dir
+            )
+            if not attributes_resolved:
+                return None
+            source_files.append(self.attributes_file)
+            source_files.extend(sorted(attributes_includes))
+        source_files.extend(find_docinfo_files(input_path, base_dir))
+        source_files.extend(
+            [
+                self.PANDOC_FILTER_PATH,
+                self.PANDOC_LUA_FILTER_PATH,
+                self.PANDOC_LUA_CODEBLOCK_FIX_PATH,
+            ]
+        )
+        return self.cache.key(source_files)
+
+    @staticmethod
+    def fix_sources(input_path: Path, fixed_files: set[Path]) -> dict[Path, list[str]]:
+        """Fix the AsciiDoc source files release notes are built from.
+
+        The files are fixed in place, once per run, before any conversion
+        starts: the fixes are not idempotent, and a file must not be rewritten
+        while asciidoctor reads it for another document.
 
         Args:
             input_path: Path to input .adoc file
-            output_path: Path to output .txt (markdown) file
+            fixed_files: Resolved paths of the files that were already fixed,
+                which are skipped. The files fixed by this call are added to it.
 
         Returns:
             Dictionary mapping file paths to lists of fix descriptions.
             Only includes files that had fixes applied.
-
-        Raises:
-            subprocess.CalledProcessError: If asciidoctor or pandoc command fails
         """
-        LOG.info("Processing: %s", str(input_path.absolute()))
-
-        # Create output directory if it doesn't exist
-        if not output_path.exists():
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-        else:
-            LOG.warning(
-                "Destination file %s exists. It will be overwritten!",
-                output_path,
-            )
-
         # Find base directory
         base_dir = find_adoc_base_dir(input_path)
-        LOG.info(f"Detected base directory: {base_dir}")
 
         # Fix all .adoc files in the base directory
-        LOG.info(f"Fixing .adoc files in {base_dir}...")
-        fixes_by_file = fix_adoc_files_in_directory(base_dir)
+        LOG.debug("Fixing .adoc files in %s...", base_dir)
+        fixes_by_file = fix_adoc_files_in_directory(base_dir, fixed_files)
 
         # Also fix all included files (even if outside base_dir)
-        LOG.info("Finding and fixing included files...")
-        included_files = find_included_files(input_path, base_dir)
+        LOG.debug("Finding and fixing included files...")
+        included_files, _ = find_included_files(input_path, base_dir)
         for included_file in included_files:
-            # Skip files already fixed in base_dir
-            if included_file not in fixes_by_file:
+            resolved_file = included_file.resolve()
+            # Skip files already fixed in base_dir or for another document
+            if resolved_file not in fixed_files:
+                fixed_files.add(resolved_file)
                 fixes = fix_adoc_file(included_file)
                 if fixes:
                     fixes_by_file[included_file] = fixes
@@ -2040,111 +2638,148 @@ class RelNotesConverter:
                 for fix in fixes:
                     LOG.info(f"    - {fix}")
         else:
-            LOG.info("No fixes needed in source files")
+            LOG.debug("No fixes needed in source files")
 
-        # Create temporary files for the conversion process
-        adoc_temp = None
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".xml") as xml_temp:
-            try:
-                xml_temp_path = Path(xml_temp.name)
+        return fixes_by_file
 
-                # If attributes file is provided, create a wrapper file with includes
-                # The wrapper file must be in the base directory structure, not /tmp/
-                if self.attributes_file:
-                    adoc_temp = tempfile.NamedTemporaryFile(
-                        mode="w",
-                        suffix=".adoc",
-                        dir=str(base_dir.absolute()),
-                        delete=False,
-                    )
-                    adoc_temp.write(
-                        f"include::{self.attributes_file.absolute()}[]\n\ninclude::{input_path.absolute()}[]\n"
-                    )
-                    adoc_temp.flush()
-                    adoc_temp.close()
-                    input_for_conversion = Path(adoc_temp.name)
-                else:
-                    input_for_conversion = input_path
+    def convert(self, input_path: Path, output_path: Path) -> None:
+        """Convert release notes from AsciiDoc to Markdown.
 
-                # Step 1: Convert AsciiDoc to DocBook5 XML
-                asciidoctor_cmd = [
-                    "asciidoctor",
-                    "-b",
-                    "docbook5",
-                    "-a",
-                    "fn-private=pass",
-                    "--base-dir",
-                    str(base_dir.absolute()),
-                    "-o",
-                    str(xml_temp_path.absolute()),
-                    str(input_for_conversion.absolute()),
-                ]
-                subprocess.run(asciidoctor_cmd, check=True, capture_output=True)  # noqa: S603
+        This method uses a multi-step conversion process:
+        1. Convert AsciiDoc to DocBook5 XML using asciidoctor
+        2. Convert DocBook5 XML to Markdown using pandoc with a custom filter
 
-                # Step 1.5: Preprocess XML to fix issues
-                with open(xml_temp_path, "r", encoding="utf-8") as f:
-                    xml_content = f.read()
+        We chose this process because it uses standard tools (even if they have
+        bugs/limitations) and this process was recommended by our docs team.
 
-                # Replace undefined XML entities
-                preprocessed_xml = preprocess_xml_undefined_entities(xml_content)
+        The source documentation is not 100% conformant with the AsciiDoc spec,
+        this creates a problem with the process, and we chose to fix the source
+        documents instead of creating temporary files and fix includes as well
+        as it simplifies the code, speeds later runs, and allows for an easier
+        diff to see what has changed. The source files are fixed beforehand by
+        fix_sources().
 
-                # Flatten table cells to inline content for pipe table compatibility
-                preprocessed_xml = preprocess_xml_table_cells(preprocessed_xml)
+        Args:
+            input_path: Path to input .adoc file
+            output_path: Path to output .txt (markdown) file
 
-                with open(xml_temp_path, "w", encoding="utf-8") as f:
-                    f.write(preprocessed_xml)
+        Raises:
+            subprocess.CalledProcessError: If asciidoctor or pandoc command fails
+        """
+        input_abs_path = str(input_path.absolute())
+        LOG.debug("Processing: %s", input_abs_path)
 
-                # Step 2: Convert DocBook5 XML to Markdown using pandoc with filters
-                pandoc_cmd = [
-                    "pandoc",
-                    "-f",
-                    "docbook",
-                    "--wrap=preserve",
-                    "-t",
-                    "markdown-simple_tables-multiline_tables-grid_tables+pipe_tables",
-                    f"--filter={self.PANDOC_FILTER_PATH}",
-                    f"--lua-filter={self.PANDOC_LUA_FILTER_PATH}",
-                    f"--lua-filter={self.PANDOC_LUA_CODEBLOCK_FIX_PATH}",
-                    str(xml_temp_path.absolute()),
-                    "-o",
-                    str(output_path.absolute()),
-                ]
-                subprocess.run(pandoc_cmd, check=True, capture_output=True)  # noqa: S603
+        # Create output directory if it doesn't exist
+        if not output_path.exists():
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            LOG.warning(
+                "Destination file %s exists. It will be overwritten!",
+                output_path,
+            )
 
-                # Step 3: Convert any HTML tables to markdown pipe tables
-                with open(output_path, "r", encoding="utf-8") as f:
-                    markdown_content = f.read()
+        # Find base directory
+        base_dir = find_adoc_base_dir(input_path)
+        base_dir_abs_path = str(base_dir.absolute())
+        LOG.debug("Detected base directory: %s", base_dir)
+        included_files, includes_resolved = find_included_files(input_path, base_dir)
+
+        # Reuse the result of a previous run if nothing changed since then
+        cache_key = self.cache_key(
+            input_path, base_dir, included_files, includes_resolved
+        )
+        if cache_key is not None:
+            markdown_content = self.cache.get(cache_key)
+            if markdown_content is not None:
+                output_path.write_text(markdown_content, encoding="utf-8")
+                LOG.debug("Reused cached conversion: %s -> %s", input_path, output_path)
+                return
+
+        # Temporary files created for the conversion process
+        temp_paths: list[Path] = []
+        try:
+            # If attributes file is provided, create a wrapper file with includes
+            # The wrapper file must be in the base directory structure, not /tmp/
+            if self.attributes_file:
+                wrapper_path = write_temporary_adoc(
+                    f"include::{self.attributes_file.absolute()}[]\n\ninclude::{input_abs_path}[]\n",
+                    base_dir_abs_path,
+                )
+                temp_paths.append(wrapper_path)
+                input_for_conversion = str(wrapper_path)
+            else:
+                input_for_conversion = input_abs_path
+
+            # Step 1: Convert AsciiDoc to DocBook5 XML, the XML is written to
+            # stdout and kept in memory
+            asciidoctor_cmd = [
+                "asciidoctor",
+                "-b",
+                "docbook5",
+                "-a",
+                "fn-private=pass",
+                "--base-dir",
+                base_dir_abs_path,
+                "-o",
+                "-",
+                input_for_conversion,
+            ]
+            result = subprocess.run(  # noqa: S603
+                asciidoctor_cmd,
+                check=True,
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=self.timeout,
+            )
 
-                markdown_content = convert_html_tables_to_markdown(markdown_content)
+            # Step 1.5: Preprocess XML to fix issues
+            # Replace undefined XML entities
+            preprocessed_xml = preprocess_xml_undefined_entities(result.stdout)
 
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(markdown_content)
+            # Flatten table cells to inline content for pipe table compatibility
+            preprocessed_xml = preprocess_xml_table_cells(preprocessed_xml)
 
-                # Step 4: Compact pipe tables by removing extra spaces before pipes
-                # NOTE: Disabled for now - the sed pattern affects code blocks too
-                # The Lua filter ensures code blocks have correct indentation
-                # TODO: Create a smarter sed pattern or do this in the Lua filter
-                # compact_cmd = [
-                #     'sed', '-i', '-E',
-                #     's/ +\\|/ |/g',
-                #     str(output_path.absolute())
-                # ]
-                # subprocess.run(compact_cmd, check=True)
+            # Step 2: Convert DocBook5 XML to Markdown using pandoc with filters
+            # The XML is read from stdin and the markdown written to stdout
+            result = subprocess.run(  # noqa: S603
+                self.pandoc_cmd,
+                input=preprocessed_xml,
+                check=True,
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=self.timeout,
+            )
 
-                LOG.info("Successfully converted: %s -> %s", input_path, output_path)
+            # Step 3: Convert any HTML tables to markdown pipe tables
+            markdown_content = convert_html_tables_to_markdown(result.stdout)
 
-                return fixes_by_file
+            output_path.write_text(markdown_content, encoding="utf-8")
+            if cache_key is not None:
+                self.cache.put(cache_key, markdown_content)
 
-            except Exception as e:
-                LOG.error(
-                    "Failed to convert: %s -> %s (%s)", input_path, output_path, e
-                )
-                raise
+            # Step 4: Compact pipe tables by removing extra spaces before pipes
+            # NOTE: Disabled for now - the sed pattern affects code blocks too
+            # The Lua filter ensures code blocks have correct indentation
+            # TODO: Create a smarter sed pattern or do this in the Lua filter
+            # compact_cmd = [
+            #     'sed', '-i', '-E',
+            #     's/ +\\|/ |/g',
+            #     str(output_path.absolute())
+            # ]
+            # subprocess.run(compact_cmd, check=True)
 
-            finally:
-                # Clean up temporary files
-                if adoc_temp and Path(adoc_temp.name).exists():
-                    Path(adoc_temp.name).unlink()
+            LOG.debug("Successfully converted: %s -> %s", input_path, output_path)
+
+        except Exception as e:
+            LOG.error("Failed to convert: %s -> %s (%s)", input_path, output_path, e)
+            raise
+
+        finally:
+            # Clean up temporary files
+            for temp_path in temp_paths:
+                temp_path.unlink(missing_ok=True)
 
 
 class DocsConverter:
@@ -2154,17 +2789,110 @@ class DocsConverter:
     """
 
     PANDOC_FILTER_PATH = (
-        (Path(__file__).parent / "filters/pandoc-docs-filter.py").absolute()
+        Path(__file__).parent / "filters/pandoc-docs-filter.py"
     ).absolute()
     PANDOC_LUA_FILTER_PATH = (
-        (Path(__file__).parent / "filters/tightlists.lua").absolute()
+        Path(__file__).parent / "filters/tightlists.lua"
     ).absolute()
     PANDOC_LUA_CODEBLOCK_FIX_PATH = (
         Path(__file__).parent / "filters/fix-codeblock-tables.lua"
     ).absolute()
 
-    def __init__(self, attributes_file: Path | None = None):
+    def __init__(
+        self,
+        attributes_file: Path | None = None,
+        timeout: float | None = None,
+        cache: ConversionCache | None = None,
+    ):
         self.attributes_file = attributes_file
+        # Maximum time in seconds for each external command, so a hung
+        # conversion doesn't stall the whole batch
+        self.timeout = timeout
+        self.cache = cache
+        # The pandoc command is the same for every document
+        self.pandoc_cmd = [
+            "pandoc",
+            "-f",
+            "docbook",
+            "--wrap=preserve",
+            "-t",
+            "markdown-simple_tables-multiline_tables-grid_tables+pipe_tables",
+            f"--filter={self.PANDOC_FILTER_PATH}",
+            f"--lua-filter={self.PANDOC_LUA_FILTER_PATH}",
+            f"--lua-filter={self.PANDOC_LUA_CODEBLOCK_FIX_PATH}",
+        ]
+
+    def cache_key(
+        self,
+        input_path: Path,
+        base_dir: Path,
+        included_files: set[Path],
+        includes_resolved: bool,
+    ) -> str | None:
+        """Build the cache key of a conversion.
+
+        The key covers every file asciidoctor reads: the document, its
+        includes, the attributes file and its own includes, and the docinfo
+        files.
+
+        Returns None, so the document is converted and not cached, if there's
+        no cache or if some includes couldn't be resolved: the files they
+        point to would be missing from the key.
+        """
+        if self.cache is None or not includes_resolved:
+            return None
+        source_files = [Path(__file__), input_path, *sorted(included_files)]
+        if self.attributes_file:
+            attributes_includes, attributes_resolved = find_included_files(
+                self.attributes_file, base_dir
+            )
+            if not attributes_resolved:
+                return None
+            source_files.append(self.attributes_file)
+            source_files.extend(sorted(attributes_includes))
+        source_files.extend(find_docinfo_files(input_path, base_dir))
+        source_files.extend(
+            [
+                self.PANDOC_FILTER_PATH,
+                self.PANDOC_LUA_FILTER_PATH,
+                self.PANDOC_LUA_CODEBLOCK_FIX_PATH,
+            ]
+        )
+        return self.cache.key(source_files)
+
+    @staticmethod
+    def fix_sources(input_path: Path, fixed_files: set[Path]) -> None:
+        """Fix the AsciiDoc files included by a document.
+
+        The files are fixed in place, once per run, before any conversion
+        starts: the fixes are not idempotent, and a file must not be rewritten
+        while asciidoctor reads it for another document.
+
+        Args:
+            input_path: Path to input .adoc file
+            fixed_files: Resolved paths of the files that were already fixed,
+                which are skipped. The files fixed by this call are added to it.
+        """
+        base_dir = find_adoc_base_dir(input_path)
+
+        # Fix all included files (recursively)
+        LOG.debug("Finding and fixing included files...")
+        included_files, _ = find_included_files(input_path, base_dir)
+        if included_files:
+            LOG.debug("Found %s included file(s), fixing...", len(included_files))
+            for included_file in included_files:
+                resolved_file = included_file.resolve()
+                # Shared modules are only fixed for the first document
+                if resolved_file in fixed_files:
+                    continue
+                fixed_files.add(resolved_file)
+                fixes = fix_adoc_file(included_file)
+                if fixes:
+                    LOG.info(f"  Fixed {included_file}: {len(fixes)} issue(s)")
+                    for fix in fixes:
+                        LOG.debug("    - %s", fix)
+        else:
+            LOG.debug("No included files found")
 
     def convert(self, input_path: Path, output_path: Path) -> None:
         """Convert documentation from AsciiDoc to Markdown.
@@ -2182,7 +2910,8 @@ class DocsConverter:
         Raises:
             subprocess.CalledProcessError: If asciidoctor or pandoc command fails
         """
-        LOG.info("Processing: %s", str(input_path.absolute()))
+        input_abs_path = str(input_path.absolute())
+        LOG.debug("Processing: %s", input_abs_path)
 
         # Create output directory if it doesn't exist
         if not output_path.exists():
@@ -2193,27 +2922,30 @@ class DocsConverter:
                 output_path,
             )
 
-        # Create temporary files for the conversion process
-        adoc_temp = None
-        preprocessed_temp = None
+        # Temporary files created for the conversion process
+        temp_paths: list[Path] = []
         try:
             # Find base directory first, as we need it for temp file creation
             base_dir = find_adoc_base_dir(input_path)
-            LOG.info(f"Detected base directory: {base_dir}")
-
-            # Fix all included files (recursively)
-            LOG.info("Finding and fixing included files...")
-            included_files = find_included_files(input_path, base_dir)
-            if included_files:
-                LOG.info(f"Found {len(included_files)} included file(s), fixing...")
-                for included_file in included_files:
-                    fixes = fix_adoc_file(included_file)
-                    if fixes:
-                        LOG.info(f"  Fixed {included_file}: {len(fixes)} issue(s)")
-                        for fix in fixes:
-                            LOG.debug(f"    - {fix}")
-            else:
-                LOG.info("No included files found")
+            base_dir_abs_path = str(base_dir.absolute())
+            LOG.debug("Detected base directory: %s", base_dir)
+
+            included_files, includes_resolved = find_included_files(
+                input_path, base_dir
+            )
+
+            # Reuse the result of a previous run if nothing changed since then
+            cache_key = self.cache_key(
+                input_path, base_dir, included_files, includes_resolved
+            )
+            if cache_key is not None:
+                markdown_content = self.cache.get(cache_key)
+                if markdown_content is not None:
+                    output_path.write_text(markdown_content, encoding="utf-8")
+                    LOG.debug(
+                        "Reused cached conversion: %s -> %s", input_path, output_path
+                    )
+                    return
 
             # Read and preprocess the input file
             with open(input_path, "r", encoding="utf-8") as f:
@@ -2222,174 +2954,136 @@ class DocsConverter:
             preprocessed_content, _ = preprocess_adoc_tables(content)
 
             # Create temporary file with preprocessed content in the base directory
-            preprocessed_temp = tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=".adoc",
-                delete=False,
-                encoding="utf-8",
-                dir=str(base_dir.absolute()),
+            # tempfile paths are always absolute
+            preprocessed_path = write_temporary_adoc(
+                preprocessed_content, base_dir_abs_path
             )
-            preprocessed_temp.write(preprocessed_content)
-            preprocessed_temp.flush()
-            preprocessed_temp.close()
-            preprocessed_path = Path(preprocessed_temp.name)
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".xml", delete=False
-            ) as xml_temp:
-                xml_temp_path = Path(xml_temp.name)
-                xml_temp.close()
+            temp_paths.append(preprocessed_path)
 
-                try:
-                    # If attributes file is provided, create a wrapper file with includes
-                    # The wrapper file must be in the base directory structure
-                    if self.attributes_file:
-                        adoc_temp = tempfile.NamedTemporaryFile(
-                            mode="w",
-                            suffix=".adoc",
-                            delete=False,
-                            encoding="utf-8",
-                            dir=str(base_dir.absolute()),
-                        )
-                        adoc_temp.write(
-                            f"include::{self.attributes_file.absolute()}[]\n\ninclude::{preprocessed_path.absolute()}[]\n"
-                        )
-                        adoc_temp.flush()
-                        adoc_temp.close()
-                        input_for_conversion = Path(adoc_temp.name)
-                    else:
-                        input_for_conversion = input_path
-
-                    # Step 1: Convert AsciiDoc to DocBook5 XML
-                    asciidoctor_cmd = [
-                        "asciidoctor",
-                        "-b",
-                        "docbook5",
-                        "-d",
-                        "book",
-                        "-a",
-                        "fn-private=pass",
-                        "--base-dir",
-                        str(base_dir.absolute()),
-                        "-o",
-                        str(xml_temp_path.absolute()),
-                        str(input_for_conversion.absolute()),
-                    ]
-                    result = subprocess.run(  # noqa: S603
-                        asciidoctor_cmd, check=True, capture_output=True, text=True
-                    )
-                    if result.stderr:
-                        LOG.warning(
-                            "asciidoctor warnings for %s:\n%s",
-                            input_path,
-                            result.stderr,
-                        )
-
-                    # Step 1.5: Preprocess XML to fix issues
-                    with open(xml_temp_path, "r", encoding="utf-8") as f:
-                        xml_content = f.read()
-
-                    # First escape any invalid angle brackets (like <key=value>)
-                    preprocessed_xml = preprocess_xml_escape_angle_brackets(xml_content)
-
-                    # Replace undefined XML entities before parsing
-                    preprocessed_xml = preprocess_xml_undefined_entities(
-                        preprocessed_xml
+            # DocBook XML given to pandoc, kept for debugging if pandoc fails
+            preprocessed_xml = ""
+            try:
+                # If attributes file is provided, create a wrapper file with includes
+                # The wrapper file must be in the base directory structure
+                if self.attributes_file:
+                    wrapper_path = write_temporary_adoc(
+                        f"include::{self.attributes_file.absolute()}[]\n\ninclude::{preprocessed_path}[]\n",
+                        base_dir_abs_path,
                     )
+                    temp_paths.append(wrapper_path)
+                    input_for_conversion = str(wrapper_path)
+                else:
+                    input_for_conversion = input_abs_path
 
-                    # Flatten table cells to inline content for pipe table compatibility
-                    preprocessed_xml = preprocess_xml_table_cells(preprocessed_xml)
-
-                    # Then convert list titles to formalpara
-                    preprocessed_xml = preprocess_xml_list_titles(preprocessed_xml)
-
-                    with open(xml_temp_path, "w", encoding="utf-8") as f:
-                        f.write(preprocessed_xml)
-
-                    # Step 2: Convert DocBook5 XML to Markdown using pandoc with filters
-                    pandoc_cmd = [
-                        "pandoc",
-                        "-f",
-                        "docbook",
-                        "--wrap=preserve",
-                        "-t",
-                        "markdown-simple_tables-multiline_tables-grid_tables+pipe_tables",
-                        f"--filter={self.PANDOC_FILTER_PATH}",
-                        f"--lua-filter={self.PANDOC_LUA_FILTER_PATH}",
-                        f"--lua-filter={self.PANDOC_LUA_CODEBLOCK_FIX_PATH}",
-                        str(xml_temp_path.absolute()),
-                        "-o",
-                        str(output_path.absolute()),
-                    ]
-                    subprocess.run(  # noqa: S603
-                        pandoc_cmd, check=True, capture_output=True, text=True
+                # Step 1: Convert AsciiDoc to DocBook5 XML
+                asciidoctor_cmd = [
+                    "asciidoctor",
+                    "-b",
+                    "docbook5",
+                    "-d",
+                    "book",
+                    "-a",
+                    "fn-private=pass",
+                    "--base-dir",
+                    base_dir_abs_path,
+                    "-o",
+                    "-",
+                    input_for_conversion,
+                ]
+                # The XML is written to stdout and kept in memory
+                result = subprocess.run(  # noqa: S603
+                    asciidoctor_cmd,
+                    check=True,
+                    capture_output=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    timeout=self.timeout,
+                )
+                if result.stderr:
+                    LOG.warning(
+                        "asciidoctor warnings for %s:\n%s",
+                        input_path,
+                        result.stderr,
                     )
 
-                    # Step 3: Convert any HTML tables to markdown pipe tables
-                    with open(output_path, "r", encoding="utf-8") as f:
-                        markdown_content = f.read()
+                # Step 1.5: Preprocess XML to fix issues
+                # First escape any invalid angle brackets (like <key=value>)
+                preprocessed_xml = preprocess_xml_escape_angle_brackets(result.stdout)
 
-                    markdown_content = convert_html_tables_to_markdown(markdown_content)
+                # Replace undefined XML entities before parsing
+                preprocessed_xml = preprocess_xml_undefined_entities(preprocessed_xml)
 
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        f.write(markdown_content)
+                # Flatten table cells to inline content for pipe table
+                # compatibility, then convert list titles to formalpara
+                preprocessed_xml = preprocess_xml_table_cells_and_list_titles(
+                    preprocessed_xml
+                )
 
-                    # Step 4: Compact pipe tables by removing extra spaces before pipes
-                    # NOTE: Disabled for now - the sed pattern affects code blocks too
-                    # TODO: Create a smarter sed pattern or do this in the Lua filter
-                    # compact_cmd = [
-                    #     'sed', '-i', '-E',
-                    #     's/ +\\|/ |/g',
-                    #     str(output_path.absolute())
-                    # ]
-                    # subprocess.run(compact_cmd, check=True)
+                # Step 2: Convert DocBook5 XML to Markdown using pandoc with filters
+                # The XML is read from stdin and the markdown written to stdout
+                result = subprocess.run(  # noqa: S603
+                    self.pandoc_cmd,
+                    input=preprocessed_xml,
+                    check=True,
+                    capture_output=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    timeout=self.timeout,
+                )
 
-                    LOG.info(
-                        "Successfully converted: %s -> %s", input_path, output_path
-                    )
+                # Step 3: Convert any HTML tables to markdown pipe tables
+                markdown_content = convert_html_tables_to_markdown(result.stdout)
 
-                except subprocess.CalledProcessError as e:
-                    LOG.error("Failed to convert: %s -> %s", input_path, output_path)
-                    LOG.error("Command: %s", " ".join(e.cmd))
-                    LOG.error("Return code: %s", e.returncode)
-                    if e.stdout:
-                        LOG.error(
-                            "stdout: %s",
-                            e.stdout.decode()
-                            if isinstance(e.stdout, bytes)
-                            else e.stdout,
-                        )
-                    if e.stderr:
-                        LOG.error(
-                            "stderr: %s",
-                            e.stderr.decode()
-                            if isinstance(e.stderr, bytes)
-                            else e.stderr,
-                        )
-                    # Save XML for debugging
-                    if xml_temp_path.exists():
-                        debug_xml_path = (
-                            output_path.parent / f"{output_path.stem}_debug.xml"
-                        )
-                        debug_xml_path.parent.mkdir(parents=True, exist_ok=True)
-                        LOG.error("Saving intermediate XML to: %s", debug_xml_path)
-                        import shutil
-
-                        shutil.copy(xml_temp_path, debug_xml_path)
-                    raise
+                output_path.write_text(markdown_content, encoding="utf-8")
+                if cache_key is not None:
+                    self.cache.put(cache_key, markdown_content)
 
-                except Exception as e:
-                    LOG.error(
-                        "Failed to convert: %s -> %s (%s)", input_path, output_path, e
+                # Step 4: Compact pipe tables by removing extra spaces before pipes
+                # NOTE: Disabled for now - the sed pattern affects code blocks too
+                # TODO: Create a smarter sed pattern or do this in the Lua filter
+                # compact_cmd = [
+                #     'sed', '-i', '-E',
+                #     's/ +\\|/ |/g',
+                #     str(output_path.absolute())
+                # ]
+                # subprocess.run(compact_cmd, check=True)
+
+                LOG.debug("Successfully converted: %s -> %s", input_path, output_path)
+
+            except subprocess.CalledProcessError as e:
+                LOG.error("Failed to convert: %s -> %s", input_path, output_path)
+                LOG.error("Command: %s", " ".join(e.cmd))
+                LOG.error("Return code: %s", e.returncode)
+                # Both commands run in text mode, the output is already a str.
+                # The stdout of asciidoctor is the XML, it's saved below instead.
+                if e.cmd is asciidoctor_cmd:
+                    debug_xml = e.stdout
+                else:
+                    debug_xml = preprocessed_xml
+                    if e.stdout:
+                        LOG.error("stdout: %s", e.stdout)
+                if e.stderr:
+                    LOG.error("stderr: %s", e.stderr)
+                # Save XML for debugging, unless asciidoctor didn't produce any
+                if debug_xml:
+                    debug_xml_path = (
+                        output_path.parent / f"{output_path.stem}_debug.xml"
                     )
-                    raise
+                    debug_xml_path.parent.mkdir(parents=True, exist_ok=True)
+                    LOG.error("Saving intermediate XML to: %s", debug_xml_path)
+                    debug_xml_path.write_text(debug_xml, encoding="utf-8")
+                raise
 
-                finally:
-                    # Clean up temporary files
-                    if xml_temp_path.exists():
-                        xml_temp_path.unlink()
-                    if adoc_temp and Path(adoc_temp.name).exists():
-                        Path(adoc_temp.name).unlink()
+            except Exception as e:
+                LOG.error(
+                    "Failed to convert: %s -> %s (%s)", input_path, output_path, e
+                )
+                raise
+
+            finally:
+                # Clean up temporary files
+                for temp_path in temp_paths:
+                    temp_path.unlink(missing_ok=True)
 
         except Exception as e:
             LOG.error("Failed during conversion: %s (%s)", input_path, e)
@@ -2398,75 +3092,231 @@ class DocsConverter:
         return
 
 
+# Converters of the current worker process, built once by init_worker()
+_WORKER_CONVERTERS: dict[str, DocsConverter | RelNotesConverter] = {}
+# Documents converted by the current worker process
+_WORKER_CONVERSION_COUNT = itertools.count(1)
+# Number of documents a worker converts between two memory trims
+_MEMORY_TRIM_INTERVAL = 64
+
+# glibc keeps the memory freed after converting a large document in its
+# arenas, malloc_trim() gives it back to the OS. Not available on other libcs.
+try:
+    _MALLOC_TRIM = ctypes.CDLL("libc.so.6").malloc_trim
+except (OSError, AttributeError):
+    _MALLOC_TRIM = None
+
+
+def init_worker(
+    log_queue: multiprocessing.Queue,
+    attributes_file: Path | None,
+    timeout: float | None,
+    cache_dir: Path | None,
+    tool_versions: bytes | None,
+) -> None:
+    """Set up logging and build the converters used by a worker process.
+
+    Runs once per worker, so the converters are not pickled and sent along
+    with every document.
+
+    Log records are sent to the main process instead of being written by
+    each worker, so the lines of different workers don't get interleaved.
+
+    Args:
+        log_queue: Queue the log records are sent to
+        attributes_file: Path to the AsciiDoc attributes file, if any
+        timeout: Maximum time in seconds for each external command, if any
+        cache_dir: Directory of the cache of converted documents, if any
+        tool_versions: Versions of asciidoctor and pandoc, from
+            get_tool_versions()
+    """
+    for handler in LOG.handlers[:]:
+        LOG.removeHandler(handler)
+    LOG.addHandler(QueueHandler(log_queue))
+
+    cache = ConversionCache(cache_dir, tool_versions) if cache_dir else None
+    _WORKER_CONVERTERS["docs"] = DocsConverter(
+        attributes_file=attributes_file, timeout=timeout, cache=cache
+    )
+    _WORKER_CONVERTERS["relnotes"] = RelNotesConverter(
+        attributes_file=attributes_file, timeout=timeout, cache=cache
+    )
+
+
+def convert_document(task: Tuple[str, Path, Path]) -> Tuple[Path, str | None]:
+    """Convert a single document in a worker process.
+
+    Exceptions are not propagated, they are returned as a string so that one
+    failing document does not stop the results of the rest of the batch from
+    being collected.
+
+    Args:
+        task: Tuple of (converter_name, input_path, output_path), where
+            converter_name is either "docs" or "relnotes"
+
+    Returns:
+        Tuple of (input_path, error). error is None when the conversion
+        succeeded.
+    """
+    converter_name, input_path, output_path = task
+    try:
+        _WORKER_CONVERTERS[converter_name].convert(input_path, output_path)
+    except Exception as e:
+        return input_path, str(e)
+    finally:
+        # Workers live for the whole batch, don't let their RSS only grow
+        if next(_WORKER_CONVERSION_COUNT) % _MEMORY_TRIM_INTERVAL == 0:
+            gc.collect()
+            if _MALLOC_TRIM is not None:
+                _MALLOC_TRIM(0)
+    return input_path, None
+
+
 if __name__ == "__main__":
     parser = get_argument_parser()
     args = parser.parse_args()
 
-    failed_conversions = []
-    successful_conversions = []
-    all_fixes = {}  # Accumulate all fixes across all conversions
+    # The cache is set up once here, so a cache directory that can't be
+    # created fails the run with a single error instead of breaking every
+    # worker, and the tool versions are not queried by each of them
+    tool_versions = None
+    if args.cache_dir:
+        try:
+            args.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            parser.error(f"can't create cache directory {args.cache_dir}: {e}")
+        tool_versions = get_tool_versions(args.timeout)
 
+    failed_conversions = []
+    # Only the failures are listed in the summary, successes are just counted
+    successful_count = 0
+    # Fixes applied to the source files, by file
+    all_fixes: dict[Path, list[str]] = {}
+
+    # Documents and release notes are converted by the same worker processes
+    # in a single batch. They are scheduled largest first so a big book
+    # doesn't start last and keep a single worker busy at the end, and their
+    # results are handled as soon as each of them finishes.
+    tasks = []
     if args.input_dir:
-        docs_converter = DocsConverter(attributes_file=args.attributes_file)
-        for input_path, output_path in red_hat_docs_path(
-            args.input_dir,
-            args.output_dir,
-            args.docs_version,
-            args.exclude_titles,
-            args.remap_titles,
-        ):
-            try:
-                fixes_by_file = docs_converter.convert(input_path, output_path) or {}
-                successful_conversions.append(str(input_path))
-                # Merge fixes into all_fixes
-                for file_path, fixes in fixes_by_file.items():
-                    if file_path not in all_fixes:
-                        all_fixes[file_path] = fixes
-            except Exception as e:
-                failed_conversions.append((str(input_path), str(e)))
-                LOG.error("Failed to convert %s: %s", input_path, str(e))
-                LOG.error("Continuing with next document...")
-
+        tasks.extend(
+            ("docs", input_path, output_path)
+            for input_path, output_path in red_hat_docs_path(
+                args.input_dir,
+                args.output_dir,
+                args.docs_version,
+                args.exclude_titles,
+                args.remap_titles,
+            )
+        )
     if args.relnotes_dir:
-        relnotes_converter = RelNotesConverter(attributes_file=args.attributes_file)
-        for input_path, output_path in red_hat_relnotes_path(
-            args.relnotes_dir,
-            args.output_dir,
-            args.docs_version,
-        ):
-            try:
-                fixes_by_file = relnotes_converter.convert(input_path, output_path)
-                successful_conversions.append(str(input_path))
-                # Merge fixes into all_fixes
-                for file_path, fixes in fixes_by_file.items():
-                    if file_path not in all_fixes:
-                        all_fixes[file_path] = fixes
-            except Exception as e:
-                failed_conversions.append((str(input_path), str(e)))
-                LOG.error("Failed to convert %s: %s", input_path, str(e))
-                LOG.error("Continuing with next document...")
-
-    # Print summary
-    LOG.info("\n" + "=" * 80)
-    LOG.info("CONVERSION SUMMARY:")
-    LOG.info(f"  Successful: {len(successful_conversions)}")
-    LOG.info(f"  Failed: {len(failed_conversions)}")
-
-    if failed_conversions:
-        LOG.info("\nFailed conversions:")
-        for path, error in failed_conversions:
-            LOG.info(f"  - {path}")
-            LOG.info(f"    Error: {error[:100]}...")  # First 100 chars of error
-
-    if all_fixes:
-        LOG.info("\n" + "-" * 80)
-        LOG.info("SOURCE FILE FIXES APPLIED:")
-        LOG.info(f"  Total files fixed: {len(all_fixes)}")
-        LOG.info("\nFiles with fixes:")
-        for file_path in sorted(all_fixes.keys()):
-            fixes = all_fixes[file_path]
-            LOG.info(f"\n  {file_path}:")
-            for fix in fixes:
-                LOG.info(f"    - {fix}")
-
-    LOG.info("\n" + "=" * 80)
+        tasks.extend(
+            ("relnotes", input_path, output_path)
+            for input_path, output_path in red_hat_relnotes_path(
+                args.relnotes_dir,
+                args.output_dir,
+                args.docs_version,
+            )
+        )
+
+    # Inputs that can't be read (e.g. dangling symlinks) fail here, without
+    # starting asciidoctor for them
+    sized_tasks = []
+    for task in tasks:
+        try:
+            sized_tasks.append((task[1].stat().st_size, task))
+        except OSError as e:
+            LOG.error("Failed to convert %s: %s", task[1], e)
+            failed_conversions.append((str(task[1]), str(e)[:100]))
+    sized_tasks.sort(key=lambda sized_task: sized_task[0], reverse=True)
+
+    # The source files are fixed in place before any conversion starts, each
+    # of them only once. The workers then only read them, so a module shared
+    # by several documents is never rewritten while asciidoctor reads it.
+    converter_classes = {"docs": DocsConverter, "relnotes": RelNotesConverter}
+    fixed_files: set[Path] = set()
+    tasks = []
+    for _, task in sized_tasks:
+        converter_name, input_path, _ = task
+        try:
+            fixes_by_file = converter_classes[converter_name].fix_sources(
+                input_path, fixed_files
+            )
+        except Exception as e:
+            LOG.error("Failed to fix the sources of %s: %s", input_path, e)
+            failed_conversions.append((str(input_path), str(e)[:100]))
+            continue
+        if fixes_by_file:
+            all_fixes.update(fixes_by_file)
+        tasks.append(task)
+
+    log_queue = multiprocessing.Queue()
+    # Log records are written through tqdm while the progress bar is shown, so
+    # the bar is redrawn below them instead of being torn. The listener is
+    # created inside, to write to the handlers that tqdm swapped in.
+    with logging_redirect_tqdm():
+        log_listener = QueueListener(log_queue, *LOG.handlers)
+        log_listener.start()
+        with ProcessPoolExecutor(
+            max_workers=args.jobs,
+            initializer=init_worker,
+            initargs=(
+                log_queue,
+                args.attributes_file,
+                args.timeout,
+                args.cache_dir,
+                tool_versions,
+            ),
+        ) as executor:
+            futures = {executor.submit(convert_document, task): task for task in tasks}
+            # The progress bar is only shown on a terminal, it would just add
+            # noise to a redirected log
+            for future in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="Converting",
+                disable=None,
+            ):
+                try:
+                    input_path, error = future.result()
+                except Exception as e:
+                    # The worker process died, e.g. killed by the OOM killer
+                    input_path, error = futures[future][1], str(e)
+                if error is not None:
+                    LOG.error("Failed to convert %s: %s", input_path, error)
+                    # Only the first 100 chars of the error are shown in the
+                    # summary, don't hold on to the rest of it until then
+                    failed_conversions.append((str(input_path), error[:100]))
+                    continue
+                successful_count += 1
+        # Flush the records of the workers before printing the summary
+        log_listener.stop()
+
+    # Print summary, as a single log record so it isn't interleaved with
+    # other output. It is not built at all if INFO records are dropped.
+    if LOG.isEnabledFor(logging.INFO):
+        summary = [
+            "",
+            "=" * 80,
+            "CONVERSION SUMMARY:",
+            f"  Successful: {successful_count}",
+            f"  Failed: {len(failed_conversions)}",
+        ]
+
+        if failed_conversions:
+            summary.append("\nFailed conversions:")
+            for path, error in failed_conversions:
+                summary.append(f"  - {path}")
+                summary.append(f"    Error: {error}...")
+
+        if all_fixes:
+            summary.append("\n" + "-" * 80)
+            summary.append("SOURCE FILE FIXES APPLIED:")
+            summary.append(f"  Total files fixed: {len(all_fixes)}")
+            summary.append("\nFiles with fixes:")
+            for file_path, fixes in sorted(all_fixes.items()):
+                summary.append(f"\n  {file_path}:")
+                summary.extend(f"    - {fix}" for fix in fixes)
+
+        summary.append("\n" + "=" * 80)
+        LOG.info("%s", "\n".join(summary))